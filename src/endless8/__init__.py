@@ -3,24 +3,52 @@
 pydantic-ai と claudecode-model を使用したコンテキスト効率の良いタスク実行ループエンジン。
 """
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
 try:
     __version__ = version("endless8")
 except PackageNotFoundError:
     __version__ = "0.0.0"  # 開発モード（未インストール時）
 
-from endless8.config import EngineConfig
-from endless8.engine import Engine
-from endless8.models import (
-    ExecutionResult,
-    ExecutionSummary,
-    IntakeResult,
-    JudgmentResult,
-    Knowledge,
-    LoopResult,
-    TaskInput,
-)
+if TYPE_CHECKING:
+    from endless8.config import EngineConfig
+    from endless8.engine import Engine
+    from endless8.models import (
+        ExecutionResult,
+        ExecutionSummary,
+        IntakeResult,
+        JudgmentResult,
+        Knowledge,
+        LoopResult,
+        TaskInput,
+    )
+
+# Public re-exports are resolved on first access so that importing a
+# submodule (e.g. the CLI for `e8 --version`) does not pull in the engine
+# and its agent dependencies.
+_LAZY_EXPORTS: dict[str, str] = {
+    "Engine": "endless8.engine",
+    "EngineConfig": "endless8.config",
+    "TaskInput": "endless8.models",
+    "IntakeResult": "endless8.models",
+    "ExecutionResult": "endless8.models",
+    "ExecutionSummary": "endless8.models",
+    "JudgmentResult": "endless8.models",
+    "LoopResult": "endless8.models",
+    "Knowledge": "endless8.models",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
@@ -9,7 +9,7 @@ This module defines the protocols (interfaces) for the 4 agents:
 
 from typing import Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from endless8.models import (
     CommandResult,
@@ -25,6 +25,8 @@ from endless8.raw_log import RawLogCollector
 class ExecutionContext(BaseModel):
     """実行エージェントに渡すコンテキスト。"""
 
+    model_config = ConfigDict(frozen=True)
+
     task: str = Field(..., description="タスクの説明")
     criteria: list[str] = Field(..., description="完了条件のリスト")
     iteration: int = Field(..., ge=1, description="イテレーション番号")
@@ -39,13 +41,27 @@ class ExecutionContext(BaseModel):
     )
 
 
+class CommandCriterionResult(BaseModel):
+    """コマンド条件の判定結果（Engine 内部用）。"""
+
+    criterion_index: int = Field(
+        ..., ge=0, description="criteria リスト内のインデックス"
+    )
+    description: str = Field(..., description="条件の表示名")
+    command: str = Field(..., description="実行したコマンド")
+    is_met: bool = Field(..., description="終了コード 0 = True")
+    result: CommandResult = Field(..., description="実行結果")
+
+
 class JudgmentContext(BaseModel):
     """判定エージェントに渡すコンテキスト。"""
 
+    model_config = ConfigDict(frozen=True)
+
     task: str = Field(..., description="タスクの説明")
     criteria: list[str] = Field(..., description="意味的完了条件のテキストのみ")
     execution_summary: ExecutionSummary = Field(..., description="実行サマリ")
-    command_results: list["CommandCriterionResult"] | None = Field(
+    command_results: list[CommandCriterionResult] | None = Field(
         None, description="コマンド条件の判定結果（FR-007）"
     )
     custom_prompt: str | None = Field(None, description="prompts.judgment からの上書き")
@@ -133,18 +149,6 @@ class SummaryAgentProtocol(Protocol):
         ...
 
 
-class CommandCriterionResult(BaseModel):
-    """コマンド条件の判定結果（Engine 内部用）。"""
-
-    criterion_index: int = Field(
-        ..., ge=0, description="criteria リスト内のインデックス"
-    )
-    description: str = Field(..., description="条件の表示名")
-    command: str = Field(..., description="実行したコマンド")
-    is_met: bool = Field(..., description="終了コード 0 = True")
-    result: CommandResult = Field(..., description="実行結果")
-
-
 class JudgmentAgentProtocol(Protocol):
     """判定エージェントのインターフェース。
 
@@ -54,9 +54,117 @@ EXECUTION_SYSTEM_PROMPT = """あなたはタスク実行エージェントです
 """
 
 
+# Prompt templates, formatted per call with the execution context
+_EXECUTION_PROMPT_TEMPLATE = """## タスク
+{task}
+
+## 作業ディレクトリ
+{working_directory}
+すべてのファイル操作はこのディレクトリを基準に行ってください。
+
+## 完了条件
+{criteria}
+
+## イテレーション
+{iteration}
+
+## 履歴コンテキスト
+{history_context}
+
+## 関連するナレッジ
+{knowledge_context}
+"""
+
+_SUGGESTED_NEXT_ACTION_TEMPLATE = """
+## 前回の判定フィードバック
+{suggested_next_action}
+"""
+
+_RAW_OUTPUT_TEMPLATE = """
+## 前回の生出力
+{raw_output_context}
+"""
+
+
+# Context sections longer than this are compressed before prompting
+_CONTEXT_MAX_CHARS = 4000
+
+
+def _truncate_middle(text: str, max_chars: int) -> str:
+    """Cut the middle out of text so that it fits within max_chars.
+
+    Args:
+        text: Text to shorten.
+        max_chars: Maximum length of the result.
+
+    Returns:
+        The original text, or its head and tail around an omission marker.
+    """
+    if len(text) <= max_chars:
+        return text
+    # Size the marker for the largest possible count so the result fits
+    keep = max(max_chars - len(f"\n（中略 {len(text)} 文字）\n"), 0)
+    head = keep // 2
+    tail = keep - head
+    omitted = len(text) - keep
+    return f"{text[:head]}\n（中略 {omitted} 文字）\n{text[len(text) - tail :]}"
+
+
+def _compress_context(text: str, max_chars: int = _CONTEXT_MAX_CHARS) -> str:
+    """Shrink an oversized context section before embedding it in the prompt.
+
+    Text within the limit is returned unchanged. Otherwise consecutive
+    duplicate lines are collapsed and, if still too long, the oldest lines
+    are dropped so that the most recent entries are kept. A newest line
+    that alone exceeds the limit is cut down to its head and tail.
+
+    Args:
+        text: History or knowledge context string.
+        max_chars: Maximum length of the returned text.
+
+    Returns:
+        The original text, or a compressed version of it.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    lines: list[str] = []
+    for line in text.splitlines():
+        if not lines or line != lines[-1]:
+            lines.append(line)
+
+    # Reserve room for the omitted-lines marker
+    budget = max_chars - len(f"（古い {len(lines)} 行を省略）\n")
+    kept: list[str] = []
+    size = 0
+    for line in reversed(lines):
+        size += len(line) + 1
+        if size > budget:
+            if not kept:
+                kept.append(_truncate_middle(line, budget))
+            break
+        kept.append(line)
+    kept.reverse()
+
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.insert(0, f"（古い {omitted} 行を省略）")
+    return "\n".join(kept)
+
+
 class ExecutionAgent:
     """Execution Agent for running tasks with claudecode-model."""
 
+    __slots__ = (
+        "_append_system_prompt",
+        "_model_name",
+        "_allowed_tools",
+        "_timeout",
+        "_message_callback",
+        "_max_turns",
+        "_raw_log_collector",
+    )
+
     def __init__(
         self,
         append_system_prompt: str | None = None,
@@ -119,6 +227,32 @@ class ExecutionAgent:
 
         return composed
 
+    def _create_agent(self) -> Agent[None, ExecutionResult]:
+        """Create a fresh pydantic-ai agent and model.
+
+        A new model is built for every run so that each iteration starts
+        with a fresh context and the current raw log collector.
+
+        Returns:
+            Newly created agent instance.
+        """
+        system_prompt = EXECUTION_SYSTEM_PROMPT
+        if self._append_system_prompt:
+            system_prompt += f"\n\n{self._append_system_prompt}"
+
+        model = create_agent_model(
+            self._model_name,
+            max_turns=self._max_turns,
+            allowed_tools=self._allowed_tools,
+            timeout=self._timeout,
+            message_callback=self._compose_callback(),
+        )
+        return Agent(
+            model,
+            output_type=ExecutionResult,
+            system_prompt=system_prompt,
+        )
+
     def _build_prompt(self, context: ExecutionContext) -> str:
         """Build the execution prompt from context.
 
@@ -128,35 +262,22 @@ class ExecutionAgent:
         Returns:
             Formatted prompt string.
         """
-        prompt = f"""## タスク
-{context.task}
-
-## 作業ディレクトリ
-{context.working_directory}
-すべてのファイル操作はこのディレクトリを基準に行ってください。
-
-## 完了条件
-{chr(10).join(f"- {c}" for c in context.criteria)}
-
-## イテレーション
-{context.iteration}
-
-## 履歴コンテキスト
-{context.history_context}
-
-## 関連するナレッジ
-{context.knowledge_context}
-"""
+        prompt = _EXECUTION_PROMPT_TEMPLATE.format(
+            task=context.task,
+            working_directory=context.working_directory,
+            criteria="\n".join(map("- {}".format, context.criteria)),
+            iteration=context.iteration,
+            history_context=_compress_context(context.history_context),
+            knowledge_context=_compress_context(context.knowledge_context),
+        )
         if context.suggested_next_action is not None:
-            prompt += f"""
-## 前回の判定フィードバック
-{context.suggested_next_action}
-"""
+            prompt += _SUGGESTED_NEXT_ACTION_TEMPLATE.format(
+                suggested_next_action=context.suggested_next_action
+            )
         if context.raw_output_context is not None:
-            prompt += f"""
-## 前回の生出力
-{context.raw_output_context}
-"""
+            prompt += _RAW_OUTPUT_TEMPLATE.format(
+                raw_output_context=context.raw_output_context
+            )
         return prompt
 
     async def run(self, context: ExecutionContext) -> ExecutionResult:
@@ -168,24 +289,7 @@ class ExecutionAgent:
         Returns:
             ExecutionResult with status, output, and artifacts.
         """
-        system_prompt = EXECUTION_SYSTEM_PROMPT
-        if self._append_system_prompt:
-            system_prompt += f"\n\n{self._append_system_prompt}"
-
-        model = create_agent_model(
-            self._model_name,
-            max_turns=self._max_turns,
-            allowed_tools=self._allowed_tools,
-            timeout=self._timeout,
-            message_callback=self._compose_callback(),
-        )
-
-        agent: Agent[None, ExecutionResult] = Agent(
-            model,
-            output_type=ExecutionResult,
-            system_prompt=system_prompt,
-        )
-
+        agent = self._create_agent()
         prompt = self._build_prompt(context)
         result = await agent.run(prompt)
 
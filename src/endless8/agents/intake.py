@@ -6,9 +6,11 @@ The Intake Agent is responsible for:
 - Refining criteria based on user answers
 """
 
+from __future__ import annotations
+
 from pydantic_ai import Agent
 
-from endless8.agents.model_factory import create_agent_model
+from endless8.agents.model_factory import NO_TOOLS, create_agent_model
 from endless8.models import IntakeResult
 
 DEFAULT_INTAKE_PROMPT = """あなたは受付エージェントです。
@@ -75,9 +77,33 @@ suggested_tools: タスク実行に推奨されるツールのリスト
 """
 
 
+# Prompt templates, formatted per call with the task and criteria
+_INTAKE_PROMPT_TEMPLATE = """## タスク
+{task}
+
+## 完了条件
+{criteria}
+"""
+
+_CLARIFICATION_ANSWERS_TEMPLATE = """
+
+## 明確化の回答
+{answers}
+
+上記の回答を踏まえて、完了条件を具体化してください。
+"""
+
+
 class IntakeAgent:
     """Intake Agent for validating task and criteria."""
 
+    __slots__ = (
+        "_model_name",
+        "_timeout",
+        "_max_turns",
+        "_agent",
+    )
+
     def __init__(
         self,
         model_name: str = "anthropic:claude-sonnet-4-5",
@@ -96,6 +122,27 @@ class IntakeAgent:
         self._model_name = model_name
         self._timeout = timeout
         self._max_turns = max_turns
+        self._agent: Agent[None, IntakeResult] | None = None
+
+    def _get_agent(self) -> Agent[None, IntakeResult]:
+        """Get the pydantic-ai agent, creating it on first use.
+
+        Returns:
+            Cached agent instance.
+        """
+        if self._agent is None:
+            model = create_agent_model(
+                self._model_name,
+                max_turns=self._max_turns,
+                allowed_tools=NO_TOOLS,  # No tools - pure text/JSON output only
+                timeout=self._timeout,
+            )
+            self._agent = Agent(
+                model,
+                output_type=IntakeResult,
+                system_prompt=DEFAULT_INTAKE_PROMPT,
+            )
+        return self._agent
 
     def _build_prompt(
         self,
@@ -113,26 +160,14 @@ class IntakeAgent:
         Returns:
             Formatted prompt string.
         """
-        criteria_text = "\n".join(f"- {c}" for c in criteria)
-
-        prompt = f"""## タスク
-{task}
-
-## 完了条件
-{criteria_text}
-"""
+        criteria_text = "\n".join(map("- {}".format, criteria))
+        prompt = _INTAKE_PROMPT_TEMPLATE.format(task=task, criteria=criteria_text)
 
         if clarification_answers:
             answers_text = "\n".join(
                 f"Q: {q}\nA: {a}" for q, a in clarification_answers.items()
             )
-            prompt += f"""
-
-## 明確化の回答
-{answers_text}
-
-上記の回答を踏まえて、完了条件を具体化してください。
-"""
+            prompt += _CLARIFICATION_ANSWERS_TEMPLATE.format(answers=answers_text)
 
         return prompt
 
@@ -152,19 +187,7 @@ class IntakeAgent:
         Returns:
             IntakeResult with validation status and any clarification questions.
         """
-        model = create_agent_model(
-            self._model_name,
-            max_turns=self._max_turns,
-            allowed_tools=[],  # No tools - pure text/JSON output only
-            timeout=self._timeout,
-        )
-
-        agent: Agent[None, IntakeResult] = Agent(
-            model,
-            output_type=IntakeResult,
-            system_prompt=DEFAULT_INTAKE_PROMPT,
-        )
-
+        agent = self._get_agent()
         prompt = self._build_prompt(task, criteria, clarification_answers)
         result = await agent.run(prompt)
 
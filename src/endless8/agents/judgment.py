@@ -6,21 +6,28 @@ The Judgment Agent is responsible for:
 - Suggesting next actions when not complete
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
+import random
 
-from claudecode_model.exceptions import CLIExecutionError
 from pydantic_ai import Agent
 
 from endless8.agents import JudgmentContext
-from endless8.agents.model_factory import create_agent_model
+from endless8.agents.model_factory import (
+    NO_TOOLS,
+    CLIExecutionError,
+    create_agent_model,
+)
 from endless8.models import JudgmentResult
 
 logger = logging.getLogger(__name__)
 
 # Retry configuration for CLI errors
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_RETRY_DELAY = 2.0  # seconds
+DEFAULT_RETRY_DELAY = 2.0  # seconds, base delay for exponential backoff
+MAX_RETRY_DELAY = 30.0  # seconds, cap for a single backoff delay
 # Retry configuration for output validation errors (pydantic-ai)
 DEFAULT_RESULT_RETRIES = 3
 
@@ -59,9 +66,42 @@ DEFAULT_JUDGMENT_PROMPT = """あなたは判定エージェントです。
 """
 
 
+# Prompt template, formatted per call with the judgment context
+_JUDGMENT_PROMPT_TEMPLATE = """## タスク
+{task}
+
+## 完了条件
+{criteria}
+
+## 実行結果
+- イテレーション: {iteration}
+- アプローチ: {approach}
+- 結果: {result}
+- 理由: {reason}
+- 成果物: {artifacts}
+
+## 使用ツール
+{tools_used}
+
+## 変更ファイル
+{files_modified}
+"""
+
+
 class JudgmentAgent:
     """Judgment Agent for evaluating completion criteria."""
 
+    __slots__ = (
+        "_model_name",
+        "_timeout",
+        "_max_turns",
+        "_max_retries",
+        "_retry_delay",
+        "_result_retries",
+        "_agent",
+        "_agent_system_prompt",
+    )
+
     def __init__(
         self,
         model_name: str = "anthropic:claude-sonnet-4-5",
@@ -78,7 +118,8 @@ class JudgmentAgent:
             timeout: Timeout in seconds for SDK queries.
             max_turns: Maximum number of turns for the agent.
             max_retries: Maximum number of retries on CLI errors.
-            retry_delay: Delay in seconds between retries.
+            retry_delay: Base delay in seconds for exponential backoff between
+                retries. The total backoff wait is capped at ``timeout``.
             result_retries: Maximum number of retries for output validation errors.
         """
         if max_turns < 1:
@@ -90,6 +131,44 @@ class JudgmentAgent:
         self._retry_delay = retry_delay
         self._result_retries = result_retries
         self._agent: Agent[None, JudgmentResult] | None = None
+        self._agent_system_prompt: str | None = None
+
+    def _get_agent(self, system_prompt: str) -> Agent[None, JudgmentResult]:
+        """Get the pydantic-ai agent for a system prompt, creating it if needed.
+
+        Args:
+            system_prompt: System prompt the agent must use.
+
+        Returns:
+            Cached agent instance.
+        """
+        if self._agent is None or self._agent_system_prompt != system_prompt:
+            model = create_agent_model(
+                self._model_name,
+                max_turns=self._max_turns,
+                allowed_tools=NO_TOOLS,  # No tools - pure text/JSON output only
+                timeout=self._timeout,
+            )
+            self._agent = Agent(
+                model,
+                output_type=JudgmentResult,
+                system_prompt=system_prompt,
+                retries=self._result_retries,
+            )
+            self._agent_system_prompt = system_prompt
+        return self._agent
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Compute the jittered exponential backoff delay before a retry.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(self._retry_delay * 2.0**attempt, MAX_RETRY_DELAY)
+        return delay * (0.5 + random.random() * 0.5)
 
     def _build_prompt(self, context: JudgmentContext) -> str:
         """Build the judgment prompt from context.
@@ -100,28 +179,20 @@ class JudgmentAgent:
         Returns:
             Formatted prompt string.
         """
-        criteria_text = "\n".join(f"- {c}" for c in context.criteria)
+        criteria_text = "\n".join(map("- {}".format, context.criteria))
         summary = context.execution_summary
 
-        prompt = f"""## タスク
-{context.task}
-
-## 完了条件
-{criteria_text}
-
-## 実行結果
-- イテレーション: {summary.iteration}
-- アプローチ: {summary.approach}
-- 結果: {summary.result.value}
-- 理由: {summary.reason}
-- 成果物: {", ".join(summary.artifacts) if summary.artifacts else "なし"}
-
-## 使用ツール
-{", ".join(summary.metadata.tools_used) if summary.metadata.tools_used else "なし"}
-
-## 変更ファイル
-{", ".join(summary.metadata.files_modified) if summary.metadata.files_modified else "なし"}
-"""
+        prompt = _JUDGMENT_PROMPT_TEMPLATE.format(
+            task=context.task,
+            criteria=criteria_text,
+            iteration=summary.iteration,
+            approach=summary.approach,
+            result=summary.result.value,
+            reason=summary.reason,
+            artifacts=", ".join(summary.artifacts) or "なし",
+            tools_used=", ".join(summary.metadata.tools_used) or "なし",
+            files_modified=", ".join(summary.metadata.files_modified) or "なし",
+        )
 
         # FR-007: Include command results as additional context for semantic judgment
         if context.command_results:
@@ -161,41 +232,32 @@ class JudgmentAgent:
         prompt = self._build_prompt(context)
 
         last_error: Exception | None = None
+        total_wait = 0.0
 
         for attempt in range(self._max_retries):
             try:
-                # Create fresh model instance for each attempt
-                model = create_agent_model(
-                    self._model_name,
-                    max_turns=self._max_turns,
-                    allowed_tools=[],  # No tools - pure text/JSON output only
-                    timeout=self._timeout,
-                )
-
-                agent: Agent[None, JudgmentResult] = Agent(
-                    model,
-                    output_type=JudgmentResult,
-                    system_prompt=system_prompt,
-                    retries=self._result_retries,
-                )
-
+                agent = self._get_agent(system_prompt)
                 result = await agent.run(prompt)
                 return result.output
 
             except CLIExecutionError as e:
+                # Retry with a fresh model instance after a CLI failure
+                self._agent = None
                 if not e.recoverable:
                     raise
                 last_error = e
                 remaining = self._max_retries - attempt - 1
-                if remaining > 0:
+                delay = self._backoff_delay(attempt)
+                if remaining > 0 and total_wait + delay <= self._timeout:
                     logger.warning(
                         "JudgmentAgent CLI error (attempt %d/%d), retrying in %.1fs: %s",
                         attempt + 1,
                         self._max_retries,
-                        self._retry_delay,
+                        delay,
                         str(e)[:200],
                     )
-                    await asyncio.sleep(self._retry_delay)
+                    total_wait += delay
+                    await asyncio.sleep(delay)
                     continue
                 else:
                     logger.error(
@@ -204,6 +266,7 @@ class JudgmentAgent:
                         self._max_retries,
                         str(e)[:200],
                     )
+                    break
 
         # All retries exhausted
         if last_error is not None:
@@ -4,17 +4,22 @@ Provides a centralized factory function for creating pydantic-ai compatible mode
 with support for claudecode-model when available.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import TYPE_CHECKING, Union
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from claudecode_model import MessageCallbackType
 
-# Import claudecode-model adapter
+# Import claudecode-model adapter (the only runtime import of claudecode-model;
+# agents import CLIExecutionError from here)
 try:
     from claudecode_model import ClaudeCodeModel
+    from claudecode_model.exceptions import CLIExecutionError
 
     _CLAUDECODE_AVAILABLE = True
 except ImportError:
@@ -22,14 +27,23 @@ except ImportError:
     _CLAUDECODE_AVAILABLE = False
     ClaudeCodeModel = None  # type: ignore[assignment, misc]
 
+    class CLIExecutionError(Exception):  # type: ignore[no-redef]
+        """Placeholder for claudecode-model's CLI error (never raised without it)."""
+
+        recoverable: bool = False
+
+
+NO_TOOLS: tuple[str, ...] = ()
+"""Shared immutable allowed_tools value for agents that need no tools."""
+
 
 def create_agent_model(
     model_name: str,
     max_turns: int = 10,
-    allowed_tools: list[str] | None = None,
+    allowed_tools: Sequence[str] | None = None,
     timeout: float = 300.0,
-    message_callback: "MessageCallbackType | None" = None,
-) -> Union["ClaudeCodeModel", str]:
+    message_callback: MessageCallbackType | None = None,
+) -> ClaudeCodeModel | str:
     """Create an agent model for pydantic-ai.
 
     If claudecode-model is available, returns a ClaudeCodeModel instance.
@@ -38,7 +52,8 @@ def create_agent_model(
     Args:
         model_name: Name of the model to use (e.g., "anthropic:claude-sonnet-4-5").
         max_turns: Maximum number of conversation turns for ClaudeCodeModel.
-        allowed_tools: List of allowed tool names for ClaudeCodeModel.
+        allowed_tools: Allowed tool names for ClaudeCodeModel. Copied into a
+            new list, so callers may pass shared immutable sequences.
         timeout: Timeout in seconds for SDK queries.
         message_callback: Optional callback for message events.
 
@@ -48,7 +63,7 @@ def create_agent_model(
     if _CLAUDECODE_AVAILABLE and ClaudeCodeModel is not None:
         return ClaudeCodeModel(
             max_turns=max_turns,
-            allowed_tools=allowed_tools,
+            allowed_tools=list(allowed_tools) if allowed_tools is not None else None,
             timeout=timeout,
             message_callback=message_callback,
         )
@@ -58,7 +73,7 @@ def create_agent_model(
     if max_turns != 10:
         ignored.append(f"max_turns={max_turns}")
     if allowed_tools is not None:
-        ignored.append(f"allowed_tools={allowed_tools}")
+        ignored.append(f"allowed_tools={list(allowed_tools)}")
     if timeout != 300.0:
         ignored.append(f"timeout={timeout}")
     if message_callback is not None:
@@ -81,4 +96,9 @@ def is_claudecode_available() -> bool:
     return _CLAUDECODE_AVAILABLE
 
 
-__all__ = ["create_agent_model", "is_claudecode_available"]
+__all__ = [
+    "CLIExecutionError",
+    "NO_TOOLS",
+    "create_agent_model",
+    "is_claudecode_available",
+]
@@ -9,13 +9,15 @@ The Summary Agent is responsible for:
 
 import json
 import logging
+import re
 from datetime import UTC, datetime
 
 from pydantic_ai import Agent
 
-from endless8.agents.model_factory import create_agent_model
+from endless8.agents.model_factory import NO_TOOLS, create_agent_model
 from endless8.models import (
     ExecutionResult,
+    ExecutionStatus,
     ExecutionSummary,
     Knowledge,
     KnowledgeConfidence,
@@ -25,6 +27,13 @@ from endless8.models import (
 )
 from endless8.models.summary import SummaryLLMOutput
 
+# orjson is optional; it decodes stream-json lines much faster than the
+# stdlib parser when installed
+try:
+    from orjson import loads as _json_loads  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 SUMMARY_SYSTEM_PROMPT = """あなたはサマリエージェントです。
@@ -68,98 +77,67 @@ _KNOWLEDGE_TYPE_MAP: dict[str, KnowledgeType] = {
     "codebase": KnowledgeType.CODEBASE,
 }
 
+# Execution output longer than this is truncated before prompting
+_MAX_OUTPUT_CHARS = 8000
 
-def _parse_tools_from_log(raw_log: str) -> list[str]:
-    """Extract tool names from raw log.
+# Non-empty line matcher; iterating matches avoids materializing a list of
+# every line of a large log up front
+_LOG_LINE_PATTERN = re.compile(r"[^\n]+")
 
-    Args:
-        raw_log: Raw stream-json log content.
-
-    Returns:
-        List of unique tool names used.
-    """
-    tools: set[str] = set()
-    for line in raw_log.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            if data.get("type") == "tool_use":
-                tool_name = data.get("name", "")
-                if tool_name:
-                    tools.add(tool_name)
-        except json.JSONDecodeError as e:
-            logger.warning(
-                "Invalid JSON in log line (skipped): %s - Error: %s",
-                line[:100],
-                e,
-            )
-            continue
-    return sorted(tools)
 
+def _parse_log(raw_log: str) -> tuple[list[str], list[str], int]:
+    """Extract tool names, modified files and token usage from raw log.
 
-def _parse_files_from_log(raw_log: str) -> list[str]:
-    """Extract modified files from raw log.
+    The log is scanned and each line is parsed once for all three values.
+    Lines that mention neither ``"tool_use"`` nor ``"usage"`` are skipped
+    without being decoded. Invalid JSON lines are skipped and reported in
+    a single warning.
 
     Args:
         raw_log: Raw stream-json log content.
 
     Returns:
-        List of unique file paths modified.
+        Tuple of (unique tool names used, unique file paths modified,
+        total tokens used).
     """
+    tools: set[str] = set()
     files: set[str] = set()
-    for line in raw_log.split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            data = json.loads(line)
-            if data.get("type") == "tool_use":
-                tool_name = data.get("name", "")
-                if tool_name in ("Edit", "Write"):
-                    tool_input = data.get("input", {})
-                    path = tool_input.get("path", "") or tool_input.get("file_path", "")
-                    if path:
-                        files.add(path)
-        except json.JSONDecodeError as e:
-            logger.warning(
-                "Invalid JSON in log line (skipped): %s - Error: %s",
-                line[:100],
-                e,
-            )
-            continue
-    return sorted(files)
-
-
-def _parse_tokens_from_log(raw_log: str) -> int:
-    """Extract token usage from raw log.
-
-    Args:
-        raw_log: Raw stream-json log content.
-
-    Returns:
-        Total tokens used.
-    """
     total_tokens = 0
-    for line in raw_log.split("\n"):
-        line = line.strip()
-        if not line:
+    invalid_lines = 0
+    first_invalid: tuple[str, ValueError] | None = None
+    for match in _LOG_LINE_PATTERN.finditer(raw_log):
+        line = match.group().strip()
+        # Only tool_use events and usage records carry metadata; skip the
+        # decode for everything else (assistant text, system events, ...)
+        if '"tool_use"' not in line and '"usage"' not in line:
             continue
         try:
-            data = json.loads(line)
-            if "usage" in data:
-                usage = data["usage"]
-                total_tokens += usage.get("input_tokens", 0)
-                total_tokens += usage.get("output_tokens", 0)
-        except json.JSONDecodeError as e:
-            logger.warning(
-                "Invalid JSON in log line (skipped): %s - Error: %s",
-                line[:100],
-                e,
-            )
+            data = _json_loads(line)
+        except ValueError as e:
+            if not invalid_lines:
+                first_invalid = (line[:100], e)
+            invalid_lines += 1
             continue
-    return total_tokens
+        if data.get("type") == "tool_use":
+            tool_name = data.get("name", "")
+            if tool_name:
+                tools.add(tool_name)
+            if tool_name in ("Edit", "Write"):
+                tool_input = data.get("input", {})
+                path = tool_input.get("path", "") or tool_input.get("file_path", "")
+                if path:
+                    files.add(path)
+        if "usage" in data:
+            usage = data["usage"]
+            total_tokens += usage.get("input_tokens", 0)
+            total_tokens += usage.get("output_tokens", 0)
+    if first_invalid is not None:
+        logger.warning(
+            "Skipped %d invalid JSON log line(s); first: %s - Error: %s",
+            invalid_lines,
+            *first_invalid,
+        )
+    return sorted(tools), sorted(files), total_tokens
 
 
 def _build_prompt(
@@ -169,6 +147,8 @@ def _build_prompt(
 ) -> str:
     """Build LLM prompt from execution result and criteria.
 
+    Execution output longer than ``_MAX_OUTPUT_CHARS`` is truncated.
+
     Args:
         execution_result: Result from execution agent.
         iteration: Current iteration number.
@@ -177,9 +157,15 @@ def _build_prompt(
     Returns:
         Formatted prompt string for the LLM.
     """
-    criteria_text = "\n".join(f"- {c}" for c in criteria)
+    criteria_text = "\n".join(map("- {}".format, criteria))
+    output_text = execution_result.output
+    if len(output_text) > _MAX_OUTPUT_CHARS:
+        omitted = len(output_text) - _MAX_OUTPUT_CHARS
+        output_text = (
+            f"{output_text[:_MAX_OUTPUT_CHARS]}\n（以降 {omitted} 文字を省略）"
+        )
 
-    sections = [
+    parts: tuple[str, ...] = (
         f"## イテレーション {iteration}",
         "",
         "## 完了条件",
@@ -187,28 +173,34 @@ def _build_prompt(
         "",
         "## 実行結果",
         f"- ステータス: {execution_result.status.value}",
-        f"- 出力: {execution_result.output}",
-        f"- 成果物: {', '.join(execution_result.artifacts) if execution_result.artifacts else 'なし'}",
-    ]
+        f"- 出力: {output_text}",
+        f"- 成果物: {', '.join(execution_result.artifacts) or 'なし'}",
+    )
 
     if execution_result.semantic_metadata:
         sm = execution_result.semantic_metadata
-        sections.extend(
-            [
-                "",
-                "## セマンティックメタデータ",
-                f"- アプローチ: {sm.approach}",
-                f"- 戦略タグ: {', '.join(sm.strategy_tags)}",
-                f"- 発見: {', '.join(sm.discoveries) if sm.discoveries else 'なし'}",
-            ]
+        parts += (
+            "",
+            "## セマンティックメタデータ",
+            f"- アプローチ: {sm.approach}",
+            f"- 戦略タグ: {', '.join(sm.strategy_tags)}",
+            f"- 発見: {', '.join(sm.discoveries) or 'なし'}",
         )
 
-    return "\n".join(sections)
+    return "\n".join(parts)
 
 
 class SummaryAgent:
     """Summary Agent for compressing execution results via LLM."""
 
+    __slots__ = (
+        "_task_description",
+        "_model_name",
+        "_timeout",
+        "_max_turns",
+        "_agent",
+    )
+
     def __init__(
         self,
         task_description: str = "",
@@ -230,6 +222,27 @@ class SummaryAgent:
         self._model_name = model_name
         self._timeout = timeout
         self._max_turns = max_turns
+        self._agent: Agent[None, SummaryLLMOutput] | None = None
+
+    def _get_agent(self) -> Agent[None, SummaryLLMOutput]:
+        """Get the pydantic-ai agent, creating it on first use.
+
+        Returns:
+            Cached agent instance.
+        """
+        if self._agent is None:
+            model = create_agent_model(
+                self._model_name,
+                max_turns=self._max_turns,
+                allowed_tools=NO_TOOLS,
+                timeout=self._timeout,
+            )
+            self._agent = Agent(
+                model,
+                output_type=SummaryLLMOutput,
+                system_prompt=SUMMARY_SYSTEM_PROMPT,
+            )
+        return self._agent
 
     async def run(
         self,
@@ -250,48 +263,46 @@ class SummaryAgent:
             Tuple of (ExecutionSummary, list of extracted Knowledge).
         """
         # 1. Mechanical metadata extraction (preserved from original)
-        metadata = SummaryMetadata()
+        tools_used: list[str] = []
+        files_modified: list[str] = []
+        tokens_used = 0
+        strategy_tags: list[str] = []
 
         if raw_log_content:
-            metadata.tools_used = _parse_tools_from_log(raw_log_content)
-            metadata.files_modified = _parse_files_from_log(raw_log_content)
-            metadata.tokens_used = _parse_tokens_from_log(raw_log_content)
+            tools_used, files_modified, tokens_used = _parse_log(raw_log_content)
 
         if execution_result.semantic_metadata:
-            metadata.strategy_tags = execution_result.semantic_metadata.strategy_tags
+            strategy_tags = execution_result.semantic_metadata.strategy_tags
 
-        if not metadata.files_modified and execution_result.artifacts:
-            metadata.files_modified = execution_result.artifacts
+        if not files_modified and execution_result.artifacts:
+            files_modified = execution_result.artifacts
+
+        metadata = SummaryMetadata(
+            tools_used=tools_used,
+            files_modified=files_modified,
+            tokens_used=tokens_used,
+            strategy_tags=strategy_tags,
+        )
 
         # 2. LLM summarization
         prompt = _build_prompt(execution_result, iteration, criteria)
-
-        model = create_agent_model(
-            self._model_name,
-            max_turns=self._max_turns,
-            allowed_tools=[],
-            timeout=self._timeout,
-        )
-        agent: Agent[None, SummaryLLMOutput] = Agent(
-            model,
-            output_type=SummaryLLMOutput,
-            system_prompt=SUMMARY_SYSTEM_PROMPT,
-        )
+        agent = self._get_agent()
 
         llm_result = await agent.run(prompt)
         llm_output: SummaryLLMOutput = llm_result.output
 
         # 3. Build next action from LLM output
+        # trusted: llm_output is validated by pydantic-ai
         next_action: NextAction | None = None
         if llm_output.next_action:
-            next_action = NextAction(
+            next_action = NextAction.model_construct(
                 suggested_action=llm_output.next_action,
                 blockers=[],
                 partial_progress=None,
                 pending_items=[],
             )
-        elif execution_result.status.value != "success":
-            next_action = NextAction(
+        elif execution_result.status is not ExecutionStatus.SUCCESS:
+            next_action = NextAction.model_construct(
                 suggested_action="前回の失敗を分析して再試行",
                 blockers=[],
                 partial_progress=None,
@@ -311,18 +322,18 @@ class SummaryAgent:
         )
 
         # 5. Convert LLM knowledge entries to Knowledge objects
-        knowledge_list: list[Knowledge] = []
-        for entry in llm_output.knowledge_entries:
-            knowledge_type = _KNOWLEDGE_TYPE_MAP[entry.type]
-            confidence = _CONFIDENCE_MAP[entry.confidence]
-            knowledge = Knowledge(
-                type=knowledge_type,
+        # trusted: entries are validated by pydantic-ai as SummaryLLMOutput
+        source_task = self._task_description or "unknown"
+        knowledge_list = [
+            Knowledge.model_construct(
+                type=_KNOWLEDGE_TYPE_MAP[entry.type],
                 category=entry.category,
                 content=entry.content,
-                source_task=self._task_description or "unknown",
-                confidence=confidence,
+                source_task=source_task,
+                confidence=_CONFIDENCE_MAP[entry.confidence],
             )
-            knowledge_list.append(knowledge)
+            for entry in llm_output.knowledge_entries
+        ]
 
         return summary, knowledge_list
 
@@ -4,8 +4,12 @@ Provides command-line interface for running tasks.
 """
 
 import asyncio
+import heapq
+import json
 import logging
+import os
 import re
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, cast
 
@@ -15,18 +19,16 @@ if TYPE_CHECKING:
     from claude_agent_sdk.types import Message
 
 from endless8 import __version__
-from endless8.agents.execution import ExecutionAgent
-from endless8.agents.intake import IntakeAgent
-from endless8.agents.judgment import JudgmentAgent
-from endless8.agents.summary import SummaryAgent
-from endless8.config import EngineConfig, load_config
-from endless8.engine import Engine
-from endless8.history import History, KnowledgeBase
-from endless8.models import LoopStatus, ProgressEvent, ProgressEventType, TaskInput
-from endless8.models.criteria import CriterionInput, criteria_to_str_list
 
 logger = logging.getLogger(__name__)
 
+# uvloop is optional; when installed it drives the engine's event loop
+try:
+    from uvloop import new_event_loop as _engine_loop_factory  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    _engine_loop_factory = None
+
+
 app = typer.Typer(
     name="e8",
     help="endless8 - コンテキスト効率の良いタスク実行ループエンジン",
@@ -59,8 +61,9 @@ def _format_tool_call(tool_name: str, tool_input: dict[str, object]) -> str:
         command = tool_input.get("command", "")
         if command:
             # Truncate long commands
-            if len(str(command)) > 40:
-                command = str(command)[:40] + "..."
+            command = str(command)
+            if len(command) > 40:
+                command = command[:40] + "..."
             return f"{tool_name}: {command}"
     elif tool_name == "Glob" or tool_name == "Grep":
         pattern = tool_input.get("pattern", "")
@@ -135,6 +138,69 @@ def _display_command_execution_error(message: str) -> None:
     typer.echo(f"  {message}")
 
 
+# Block size for reading JSONL files from disk
+_READ_BLOCK_SIZE = 1 << 16
+# Block size for scanning JSONL files backwards from the end
+_TAIL_BLOCK_SIZE = 4096
+
+
+def _count_lines(path: Path) -> int:
+    """Count the records in a JSONL file without decoding it.
+
+    Args:
+        path: Path to the JSONL file.
+
+    Returns:
+        Number of lines, including a final line without a trailing newline.
+    """
+    count = 0
+    last = b"\n"
+    with path.open("rb") as f:
+        while block := f.read(_READ_BLOCK_SIZE):
+            count += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        count += 1
+    return count
+
+
+def _last_history_result(history_file: Path) -> str:
+    """Read the result of the last valid record in a history file.
+
+    The file is scanned backwards from the end, so only the tail is read.
+
+    Args:
+        history_file: Path to history.jsonl.
+
+    Returns:
+        The ``result`` field of the last parseable record, or "unknown".
+    """
+    with history_file.open("rb") as f:
+        pos = f.seek(0, 2)
+        partial = b""
+        while pos > 0:
+            size = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b"\n")
+            # The first piece may continue in the previous block
+            partial = lines[0] if pos > 0 else b""
+            start = 1 if pos > 0 else 0
+            for line in reversed(lines[start:]):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(
+                        "Invalid JSON in history file %s: %s", history_file, e
+                    )
+                    continue
+                return str(data.get("result", "unknown"))
+    return "unknown"
+
+
 @app.callback()
 def main(
     version: Annotated[
@@ -182,6 +248,19 @@ def run(
     ] = False,
 ) -> None:
     """タスクを実行します。"""
+    # Engine/agent dependencies (pydantic-ai, claude_agent_sdk), the config
+    # loader (PyYAML) and the pydantic models are imported here so that
+    # `--version`, `list` and `status` start without loading them.
+    from endless8.agents.execution import ExecutionAgent
+    from endless8.agents.intake import IntakeAgent
+    from endless8.agents.judgment import JudgmentAgent
+    from endless8.agents.summary import SummaryAgent
+    from endless8.config import EngineConfig, load_config
+    from endless8.engine import Engine
+    from endless8.history import History, KnowledgeBase
+    from endless8.models import LoopStatus, ProgressEvent, ProgressEventType, TaskInput
+    from endless8.models.criteria import CriterionInput, criteria_to_str_list
+
     # Load config from file if provided
     if config_file is not None:
         try:
@@ -265,9 +344,7 @@ def run(
         typer.echo(f"タスク再開: {resume}")
     else:
         # New task - create task directory with timestamp-based ID
-        from datetime import datetime
-
-        task_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        task_id = time.strftime("%Y%m%d-%H%M%S")
         task_dir = e8_dir / "tasks" / task_id
         task_dir.mkdir(parents=True, exist_ok=True)
 
@@ -433,7 +510,8 @@ def run(
                 if result.intake_result and result.intake_result.suggested_tools:
                     suggested = result.intake_result.suggested_tools
                     allowed = engine_config.claude_options.allowed_tools
-                    missing = set(suggested) - set(allowed)
+                    allowed_set = set(allowed)
+                    missing = set(suggested) - allowed_set
                     typer.echo(f"必要なツール: {', '.join(sorted(suggested))}")
                     typer.echo(f"現在の設定: {', '.join(sorted(allowed))}")
                     typer.echo(f"不足: {', '.join(sorted(missing))}")
@@ -444,8 +522,12 @@ def run(
                     typer.echo("")
                     typer.echo("  claude_options:")
                     typer.echo("    allowed_tools:")
-                    for tool in sorted(set(allowed) | missing):
-                        typer.echo(f'      - "{tool}"')
+                    typer.echo(
+                        "\n".join(
+                            f'      - "{tool}"'
+                            for tool in sorted(allowed_set | missing)
+                        )
+                    )
             elif result.error_message and _is_command_execution_error(
                 result.error_message
             ):
@@ -474,11 +556,13 @@ def run(
                 for ev in judgment.evaluations:
                     status_icon = "✓" if ev.is_met else "✗"
                     color = typer.colors.GREEN if ev.is_met else typer.colors.RED
-                    typer.secho(
-                        f"    {status_icon} {ev.criterion} (確信度: {ev.confidence:.0%})",
-                        fg=color,
+                    typer.echo(
+                        typer.style(
+                            f"    {status_icon} {ev.criterion} (確信度: {ev.confidence:.0%})",
+                            fg=color,
+                        )
+                        + f"\n      根拠: {ev.evidence}"
                     )
-                    typer.echo(f"      根拠: {ev.evidence}")
 
             # Show suggested next action if not complete
             if not judgment.is_complete and judgment.suggested_next_action:
@@ -488,7 +572,7 @@ def run(
         if result.history_path:
             typer.echo(f"履歴: {result.history_path}")
 
-    asyncio.run(run_engine())
+    asyncio.run(run_engine(), loop_factory=_engine_loop_factory)
 
 
 @app.command(name="list")
@@ -496,6 +580,10 @@ def list_tasks(
     project: Annotated[
         Path, typer.Option("--project", "-p", help="プロジェクトディレクトリ")
     ] = Path.cwd(),
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", "-n", min=1, help="表示する最新タスク数"),
+    ] = None,
 ) -> None:
     """タスク一覧を表示します。"""
     e8_dir = project / ".e8"
@@ -509,11 +597,16 @@ def list_tasks(
         raise typer.Exit(0)
 
     # Get all task directories
-    task_dirs = sorted(
-        [d for d in tasks_dir.iterdir() if d.is_dir()],
-        key=lambda x: x.name,
-        reverse=True,
-    )
+    # DirEntry.is_dir() uses the type reported by readdir, avoiding a stat
+    with os.scandir(tasks_dir) as entries:
+        task_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+    total_tasks = len(task_dirs)
+
+    # Newest first; with --limit only the newest N are selected and read
+    if limit is None:
+        task_dirs.sort(key=lambda x: x.name, reverse=True)
+    else:
+        task_dirs = heapq.nlargest(limit, task_dirs, key=lambda x: x.name)
 
     if not task_dirs:
         typer.echo("endless8 タスク一覧")
@@ -521,35 +614,28 @@ def list_tasks(
         typer.echo("タスクが見つかりません")
         raise typer.Exit(0)
 
-    typer.echo("endless8 タスク一覧")
-    typer.echo("")
-    typer.echo(f"{'TASK_ID':<24} {'STATUS':<12} {'ITERATIONS':<12} {'LAST_UPDATED'}")
+    # Collect the table and print it in a single write
+    lines = [
+        "endless8 タスク一覧",
+        "",
+        f"{'TASK_ID':<24} {'STATUS':<12} {'ITERATIONS':<12} {'LAST_UPDATED'}",
+    ]
 
     for task_dir in task_dirs:
         task_id = task_dir.name
         history_file = task_dir / "history.jsonl"
 
-        if history_file.exists():
-            # Count iterations and determine status
-            import json
-
+        try:
+            # Last modified time; a single stat also tells whether it exists
+            mtime = history_file.stat().st_mtime
+        except FileNotFoundError:
             line_count = 0
-            last_result = "unknown"
-            for line_num, line in enumerate(history_file.open(), start=1):
-                line = line.strip()
-                if line:
-                    line_count += 1
-                    # Parse last line to get result
-                    try:
-                        data = json.loads(line)
-                        last_result = data.get("result", "unknown")
-                    except json.JSONDecodeError as e:
-                        logger.warning(
-                            "Invalid JSON in history file %s:%d: %s",
-                            history_file,
-                            line_num,
-                            e,
-                        )
+            status = "unknown"
+            last_updated = "-"
+        else:
+            # Count iterations and determine status
+            line_count = _count_lines(history_file)
+            last_result = _last_history_result(history_file)
 
             # Determine status
             status = "in_progress"
@@ -561,20 +647,13 @@ def list_tasks(
             elif last_result == "error":
                 status = "error"
 
-            # Get last modified time
-            mtime = history_file.stat().st_mtime
-            from datetime import datetime
+            last_updated = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime))
 
-            last_updated = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-        else:
-            line_count = 0
-            status = "unknown"
-            last_updated = "-"
-
-        typer.echo(f"{task_id:<24} {status:<12} {line_count:<12} {last_updated}")
+        lines.append(f"{task_id:<24} {status:<12} {line_count:<12} {last_updated}")
 
-    typer.echo("")
-    typer.echo(f"合計: {len(task_dirs)} タスク")
+    lines.append("")
+    lines.append(f"合計: {total_tasks} タスク")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -589,6 +668,7 @@ def status(
 ) -> None:
     """現在の実行状態を表示します。"""
     if task_id:
+        from endless8.config import EngineConfig
         from endless8.task_manager import TaskManager
 
         # status() only needs project_dir, use minimal config
@@ -606,15 +686,13 @@ def status(
             raise typer.Exit(1) from None
 
         if json_output:
-            import json as json_mod
-
             data = {
                 "task_id": task_status.task_id,
                 "phase": task_status.phase.value,
                 "current_iteration": task_status.current_iteration,
                 "is_complete": task_status.is_complete,
             }
-            typer.echo(json_mod.dumps(data, ensure_ascii=False))
+            typer.echo(json.dumps(data, ensure_ascii=False))
         else:
             typer.echo(f"タスクID: {task_status.task_id}")
             typer.echo(f"フェーズ: {task_status.phase.value}")
@@ -633,13 +711,14 @@ def status(
     tasks_dir = e8_dir / "tasks"
     task_count = 0
     if tasks_dir.exists():
-        task_count = len([d for d in tasks_dir.iterdir() if d.is_dir()])
+        with os.scandir(tasks_dir) as entries:
+            task_count = sum(1 for entry in entries if entry.is_dir())
     typer.echo(f"タスク数: {task_count}")
 
     # Count knowledge entries
     knowledge_file = e8_dir / "knowledge.jsonl"
     if knowledge_file.exists():
-        line_count = sum(1 for _ in knowledge_file.open())
+        line_count = _count_lines(knowledge_file)
         typer.echo(f"ナレッジエントリ: {line_count}")
     else:
         typer.echo("ナレッジエントリ: 0")
@@ -656,6 +735,12 @@ def advance(
     ] = Path.cwd(),
 ) -> None:
     """タスクを1フェーズ進めます。"""
+    from endless8.agents.execution import ExecutionAgent
+    from endless8.agents.intake import IntakeAgent
+    from endless8.agents.judgment import JudgmentAgent
+    from endless8.agents.summary import SummaryAgent
+    from endless8.config import load_config
+
     if config_file is None:
         typer.echo("エラー: --config を指定してください", err=True)
         raise typer.Exit(1)
@@ -704,7 +789,7 @@ def advance(
         typer.echo(f"フェーズ: {result.phase.value}")
         typer.echo(f"イテレーション: {result.iteration}")
 
-    asyncio.run(run_advance())
+    asyncio.run(run_advance(), loop_factory=_engine_loop_factory)
 
 
 @app.command(name="inject-result")
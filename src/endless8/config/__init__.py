@@ -6,6 +6,7 @@ import yaml
 
 from endless8.config.settings import (
     COMMAND_OUTPUT_MAX_BYTES,
+    DEFAULT_ALLOWED_TOOLS,
     DEFAULT_COMMAND_TIMEOUT_SEC,
     ClaudeOptions,
     EngineConfig,
@@ -15,9 +16,16 @@ from endless8.config.settings import (
 )
 from endless8.models.criteria import CriterionInput
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 __all__ = [
     "COMMAND_OUTPUT_MAX_BYTES",
     "CriterionInput",
+    "DEFAULT_ALLOWED_TOOLS",
     "DEFAULT_COMMAND_TIMEOUT_SEC",
     "ClaudeOptions",
     "EngineConfig",
@@ -46,7 +54,7 @@ def load_config(path: str | Path) -> EngineConfig:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with config_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_SafeLoader)
 
     if not isinstance(data, dict):
         raise ValueError(f"Invalid configuration format in {config_path}")
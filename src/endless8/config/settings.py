@@ -13,6 +13,9 @@ DEFAULT_COMMAND_TIMEOUT_SEC: float = 30.0
 COMMAND_OUTPUT_MAX_BYTES: int = 10 * 1024
 """コマンド出力の最大バイト数（10KB）。"""
 
+DEFAULT_ALLOWED_TOOLS: tuple[str, ...] = ("Read", "Edit", "Write", "Bash")
+"""実行エージェントにデフォルトで許可するツール。"""
+
 
 class MaxTurnsConfig(BaseModel):
     """エージェントごとの max_turns 設定。"""
@@ -29,7 +32,7 @@ class ClaudeOptions(BaseModel):
     """claude CLI オプション。"""
 
     allowed_tools: list[str] = Field(
-        default=["Read", "Edit", "Write", "Bash"],
+        default_factory=lambda: list(DEFAULT_ALLOWED_TOOLS),
         description="許可するツール",
     )
     model: str = Field(default="sonnet", description="使用するモデル")
@@ -12,17 +12,20 @@ import logging
 import traceback
 from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
-from typing import Protocol
 
-from endless8.agents import ExecutionContext, JudgmentContext
+from endless8.agents import (
+    ExecutionAgentProtocol,
+    ExecutionContext,
+    IntakeAgentProtocol,
+    JudgmentAgentProtocol,
+    SummaryAgentProtocol,
+)
 from endless8.command.executor import CommandExecutionError
 from endless8.config import EngineConfig
 from endless8.history import History, KnowledgeBase
 from endless8.judgment import run_judgment_phase
 from endless8.models import (
-    ExecutionResult,
     ExecutionSummary,
-    IntakeResult,
     IntakeStatus,
     JudgmentResult,
     Knowledge,
@@ -34,6 +37,7 @@ from endless8.models import (
     criteria_to_str_list,
     filter_semantic_criteria,
 )
+from endless8.models.progress import ProgressData
 from endless8.raw_log import RawLogCollector
 
 # Progress callback type
@@ -44,42 +48,6 @@ ProgressCallback = (
 logger = logging.getLogger(__name__)
 
 
-class IntakeAgentProtocol(Protocol):
-    """Protocol for intake agent."""
-
-    async def run(self, task: str, criteria: list[str]) -> IntakeResult: ...
-
-
-class ExecutionAgentProtocol(Protocol):
-    """Protocol for execution agent."""
-
-    @property
-    def raw_log_collector(self) -> RawLogCollector | None: ...
-
-    @raw_log_collector.setter
-    def raw_log_collector(self, collector: RawLogCollector | None) -> None: ...
-
-    async def run(self, context: ExecutionContext) -> ExecutionResult: ...
-
-
-class SummaryAgentProtocol(Protocol):
-    """Protocol for summary agent."""
-
-    async def run(
-        self,
-        execution_result: ExecutionResult,
-        iteration: int,
-        criteria: list[str],
-        raw_log_content: str | None = None,
-    ) -> tuple[ExecutionSummary, list[Knowledge]]: ...
-
-
-class JudgmentAgentProtocol(Protocol):
-    """Protocol for judgment agent."""
-
-    async def run(self, context: JudgmentContext) -> JudgmentResult: ...
-
-
 class Engine:
     """Main task execution engine.
 
@@ -313,7 +281,7 @@ class Engine:
         event_type: ProgressEventType,
         message: str,
         iteration: int | None = None,
-        data: dict[str, object] | None = None,
+        data: ProgressData | None = None,
     ) -> None:
         """Emit a progress event.
 
@@ -327,7 +295,8 @@ class Engine:
         if on_progress is None:
             return
 
-        event = ProgressEvent(
+        # trusted: all fields are produced in-process, skip validation
+        event = ProgressEvent.model_construct(
             event_type=event_type,
             iteration=iteration,
             message=message,
@@ -489,7 +458,8 @@ class Engine:
                 )
 
                 # Build execution context
-                context = ExecutionContext(
+                # trusted: task_input and config are validated at ingress
+                context = ExecutionContext.model_construct(
                     task=task_input.task,
                     criteria=execution_criteria,
                     iteration=iteration,
@@ -705,7 +675,8 @@ class Engine:
                 self._current_iteration = iteration
 
                 # Build execution context
-                context = ExecutionContext(
+                # trusted: task_input and config are validated at ingress
+                context = ExecutionContext.model_construct(
                     task=task_input.task,
                     criteria=execution_criteria,
                     iteration=iteration,
@@ -7,17 +7,45 @@ with DuckDB-powered queries for efficient context generation.
 import json
 import logging
 from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+from pydantic_core import from_json
 
 from endless8.models import (
     ExecutionStatus,
     ExecutionSummary,
     JudgmentResult,
     LoopResult,
-    SummaryMetadata,
 )
 
 logger = logging.getLogger(__name__)
 
+# Fields persisted per record type (the model owns the row schema)
+_SUMMARY_RECORD_FIELDS: dict[str, Any] = {
+    "type": True,
+    "iteration": True,
+    "approach": True,
+    "result": True,
+    "reason": True,
+    "artifacts": True,
+    "metadata": {"tools_used", "files_modified", "tokens_used", "strategy_tags"},
+    "timestamp": True,
+}
+_JUDGMENT_RECORD_FIELDS: dict[str, Any] = {
+    "is_complete": True,
+    "evaluations": {"__all__": {"criterion", "is_met", "evidence", "confidence"}},
+    "overall_reason": True,
+    "suggested_next_action": True,
+}
+_FINAL_RESULT_RECORD_FIELDS: dict[str, Any] = {
+    "status": True,
+    "iterations_used": True,
+    "final_judgment": _JUDGMENT_RECORD_FIELDS,
+    "history_path": True,
+    "error_message": True,
+}
+
 
 class History:
     """Manages execution history stored in JSONL format.
@@ -37,6 +65,11 @@ class History:
         """
         self._path = Path(history_path)
         self._summaries: list[ExecutionSummary] = []
+        # Pre-formatted context lines (parallel to _summaries) and joined
+        # context strings keyed by limit; invalidated on append
+        self._context_lines: list[str] = []
+        self._context_cache: dict[int, str] = {}
+        self._directory_ready = False
         self._load_existing()
 
     @property
@@ -55,8 +88,8 @@ class History:
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError as e:
+                    data = from_json(line)
+                except ValueError as e:
                     logger.warning(
                         "Invalid JSON line skipped at %s:%d: %s",
                         self._path,
@@ -65,30 +98,48 @@ class History:
                     )
                     continue
                 # Only load summary records
-                if data.get("type") == "summary":
-                    summary = ExecutionSummary(
-                        iteration=data["iteration"],
-                        approach=data["approach"],
-                        result=ExecutionStatus(data["result"]),
-                        reason=data["reason"],
-                        artifacts=data.get("artifacts", []),
-                        metadata=SummaryMetadata(
-                            tools_used=data.get("metadata", {}).get("tools_used", []),
-                            files_modified=data.get("metadata", {}).get(
-                                "files_modified", []
-                            ),
-                            tokens_used=data.get("metadata", {}).get("tokens_used"),
-                            strategy_tags=data.get("metadata", {}).get(
-                                "strategy_tags", []
-                            ),
-                        ),
-                        timestamp=data.get("timestamp", ""),
+                if data.get("type") != "summary":
+                    continue
+                # Older rows may lack a timestamp; load them as before
+                data.setdefault("timestamp", "")
+                try:
+                    summary = ExecutionSummary.model_validate(data)
+                except ValidationError as e:
+                    logger.warning(
+                        "Invalid summary line skipped at %s:%d: %s",
+                        self._path,
+                        line_num,
+                        e,
                     )
-                    self._summaries.append(summary)
+                    continue
+                self._add_in_memory(summary)
+
+    def _add_in_memory(self, summary: ExecutionSummary) -> None:
+        """Track a summary in memory and invalidate cached context."""
+        self._summaries.append(summary)
+        self._context_lines.append(
+            f"[Iteration {summary.iteration}] {summary.approach} -> "
+            f"{summary.result.value}: {summary.reason}"
+        )
+        self._context_cache.clear()
 
     def _ensure_directory(self) -> None:
-        """Ensure the parent directory exists."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
+        """Ensure the parent directory exists (checked once per instance)."""
+        if not self._directory_ready:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._directory_ready = True
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Append a single JSONL record.
+
+        The file is closed before returning, so other readers (status,
+        resume) always see complete lines.
+
+        Args:
+            record: JSON-serializable record to append.
+        """
+        with self._path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
     async def append(self, summary: ExecutionSummary) -> None:
         """Append a summary to history.
@@ -96,29 +147,14 @@ class History:
         Args:
             summary: Execution summary to append.
         """
-        self._summaries.append(summary)
+        self._add_in_memory(summary)
         self._ensure_directory()
 
         # Write to JSONL file
-        record = {
-            "type": "summary",
-            "iteration": summary.iteration,
-            "approach": summary.approach,
-            "result": summary.result.value,
-            "reason": summary.reason,
-            "artifacts": summary.artifacts,
-            "metadata": {
-                "tools_used": summary.metadata.tools_used,
-                "files_modified": summary.metadata.files_modified,
-                "tokens_used": summary.metadata.tokens_used,
-                "strategy_tags": summary.metadata.strategy_tags,
-            },
-            "timestamp": summary.timestamp,
-        }
+        record = summary.model_dump(mode="json", include=_SUMMARY_RECORD_FIELDS)
 
         try:
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._write_record(record)
         except OSError as e:
             logger.error("Failed to write to history file %s: %s", self._path, e)
             raise
@@ -168,16 +204,13 @@ class History:
         Returns:
             Formatted context string.
         """
-        summaries = await self.get_recent(limit)
-        if not summaries:
-            return "履歴なし"
-
-        lines = []
-        for s in summaries:
-            lines.append(
-                f"[Iteration {s.iteration}] {s.approach} -> {s.result.value}: {s.reason}"
-            )
-        return "\n".join(lines)
+        cached = self._context_cache.get(limit)
+        if cached is None:
+            start_idx = max(0, len(self._context_lines) - limit)
+            lines = self._context_lines[start_idx:]
+            cached = "\n".join(lines) if lines else "履歴なし"
+            self._context_cache[limit] = cached
+        return cached
 
     async def count(self) -> int:
         """Count total iterations.
@@ -206,29 +239,14 @@ class History:
         """
         self._ensure_directory()
 
-        # Serialize evaluations
-        evaluations = [
-            {
-                "criterion": e.criterion,
-                "is_met": e.is_met,
-                "evidence": e.evidence,
-                "confidence": e.confidence,
-            }
-            for e in judgment.evaluations
-        ]
-
         record = {
             "type": "judgment",
             "iteration": iteration,
-            "is_complete": judgment.is_complete,
-            "evaluations": evaluations,
-            "overall_reason": judgment.overall_reason,
-            "suggested_next_action": judgment.suggested_next_action,
+            **judgment.model_dump(mode="json", include=_JUDGMENT_RECORD_FIELDS),
         }
 
         try:
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._write_record(record)
         except OSError as e:
             logger.error(
                 "Failed to write judgment to history file %s: %s", self._path, e
@@ -243,37 +261,13 @@ class History:
         """
         self._ensure_directory()
 
-        # Serialize final judgment if present
-        final_judgment_data = None
-        if result.final_judgment:
-            evaluations = [
-                {
-                    "criterion": e.criterion,
-                    "is_met": e.is_met,
-                    "evidence": e.evidence,
-                    "confidence": e.confidence,
-                }
-                for e in result.final_judgment.evaluations
-            ]
-            final_judgment_data = {
-                "is_complete": result.final_judgment.is_complete,
-                "evaluations": evaluations,
-                "overall_reason": result.final_judgment.overall_reason,
-                "suggested_next_action": result.final_judgment.suggested_next_action,
-            }
-
         record = {
             "type": "final_result",
-            "status": result.status.value,
-            "iterations_used": result.iterations_used,
-            "final_judgment": final_judgment_data,
-            "history_path": result.history_path,
-            "error_message": result.error_message,
+            **result.model_dump(mode="json", include=_FINAL_RESULT_RECORD_FIELDS),
         }
 
         try:
-            with self._path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._write_record(record)
         except OSError as e:
             logger.error(
                 "Failed to write final result to history file %s: %s", self._path, e
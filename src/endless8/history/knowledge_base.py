@@ -8,10 +8,37 @@ import json
 import logging
 from pathlib import Path
 
-from endless8.models import Knowledge, KnowledgeConfidence, KnowledgeType
+from pydantic import ValidationError
+
+from endless8.models import Knowledge, KnowledgeType
 
 logger = logging.getLogger(__name__)
 
+# Fields persisted per knowledge record, in on-disk key order (the model
+# owns the row schema)
+_KNOWLEDGE_RECORD_FIELDS = (
+    "type",
+    "category",
+    "content",
+    "source_task",
+    "confidence",
+    "example_file",
+)
+_KNOWLEDGE_RECORD_INCLUDE = set(_KNOWLEDGE_RECORD_FIELDS)
+
+
+def _to_record(item: Knowledge) -> dict[str, object]:
+    """Serialize a knowledge item as a JSONL record.
+
+    Args:
+        item: Knowledge item to serialize.
+
+    Returns:
+        Record dict with keys in on-disk order.
+    """
+    dumped = item.model_dump(mode="json", include=_KNOWLEDGE_RECORD_INCLUDE)
+    return {field: dumped[field] for field in _KNOWLEDGE_RECORD_FIELDS}
+
 
 class KnowledgeBase:
     """Manages project knowledge stored in JSONL format.
@@ -30,6 +57,11 @@ class KnowledgeBase:
         """
         self._path = Path(knowledge_path)
         self._items: list[Knowledge] = []
+        # Pre-formatted context lines (parallel to _items) and joined
+        # context strings keyed by limit; invalidated on add
+        self._context_lines: list[str] = []
+        self._context_cache: dict[int, str] = {}
+        self._directory_ready = False
         self._load_existing()
 
     def _load_existing(self) -> None:
@@ -42,47 +74,43 @@ class KnowledgeBase:
                 line = line.strip()
                 if not line:
                     continue
+                # Rows are homogeneous, so parse and validate in a single pass
                 try:
-                    data = json.loads(line)
-                except json.JSONDecodeError as e:
+                    knowledge = Knowledge.model_validate_json(line)
+                except ValidationError as e:
                     logger.warning(
-                        "Invalid JSON line skipped at %s:%d: %s",
+                        "Invalid knowledge line skipped at %s:%d: %s",
                         self._path,
                         line_num,
                         e,
                     )
                     continue
-                knowledge = Knowledge(
-                    type=KnowledgeType(data["type"]),
-                    category=data["category"],
-                    content=data["content"],
-                    source_task=data["source_task"],
-                    confidence=KnowledgeConfidence(data["confidence"]),
-                    example_file=data.get("example_file"),
-                )
-                self._items.append(knowledge)
+                self._add_in_memory(knowledge)
+
+    def _add_in_memory(self, knowledge: Knowledge) -> None:
+        """Track a knowledge item in memory and invalidate cached context."""
+        self._items.append(knowledge)
+        self._context_lines.append(f"[{knowledge.type.value}] {knowledge.content}")
+        self._context_cache.clear()
 
     def _ensure_directory(self) -> None:
-        """Ensure the parent directory exists."""
-        self._path.parent.mkdir(parents=True, exist_ok=True)
+        """Ensure the parent directory exists (checked once per instance)."""
+        if not self._directory_ready:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._directory_ready = True
 
-    def _write_item(self, item: Knowledge) -> None:
-        """Write a single item to file.
+    def _write_items(self, items: list[Knowledge]) -> None:
+        """Append items to file, opening it once per batch.
 
         Args:
-            item: Knowledge item to write.
+            items: Knowledge items to write.
         """
-        record = {
-            "type": item.type.value,
-            "category": item.category,
-            "content": item.content,
-            "source_task": item.source_task,
-            "confidence": item.confidence.value,
-            "example_file": item.example_file,
-        }
+        payload = "".join(
+            json.dumps(_to_record(item), ensure_ascii=False) + "\n" for item in items
+        )
 
         with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.write(payload)
 
     async def add(self, knowledge: Knowledge) -> None:
         """Add a knowledge item.
@@ -90,9 +118,9 @@ class KnowledgeBase:
         Args:
             knowledge: Knowledge item to add.
         """
-        self._items.append(knowledge)
+        self._add_in_memory(knowledge)
         self._ensure_directory()
-        self._write_item(knowledge)
+        self._write_items([knowledge])
 
     async def add_many(self, items: list[Knowledge]) -> None:
         """Add multiple knowledge items.
@@ -100,8 +128,12 @@ class KnowledgeBase:
         Args:
             items: List of knowledge items to add.
         """
+        if not items:
+            return
         for item in items:
-            await self.add(item)
+            self._add_in_memory(item)
+        self._ensure_directory()
+        self._write_items(items)
 
     async def get_all(self, limit: int | None = None) -> list[Knowledge]:
         """Get all knowledge items.
@@ -132,15 +164,19 @@ class KnowledgeBase:
         Returns:
             List of matching knowledge items.
         """
-        results = self._items
-
-        if type_filter is not None:
-            results = [k for k in results if k.type == type_filter]
-
-        if category_filter is not None:
-            results = [k for k in results if k.category == category_filter]
-
-        return results[-limit:]
+        # Scan newest-first in a single pass and stop once limit is reached
+        results: list[Knowledge] = []
+        for knowledge in reversed(self._items):
+            if type_filter is not None and knowledge.type != type_filter:
+                continue
+            if category_filter is not None and knowledge.category != category_filter:
+                continue
+            results.append(knowledge)
+            if len(results) == limit:
+                break
+
+        results.reverse()
+        return results
 
     async def get_context_string(self, limit: int = 10) -> str:
         """Generate context string for execution agent.
@@ -151,14 +187,12 @@ class KnowledgeBase:
         Returns:
             Formatted context string.
         """
-        items = await self.get_all(limit)
-        if not items:
-            return "ナレッジなし"
-
-        lines = []
-        for k in items:
-            lines.append(f"[{k.type.value}] {k.content}")
-        return "\n".join(lines)
+        cached = self._context_cache.get(limit)
+        if cached is None:
+            lines = self._context_lines[-limit:]
+            cached = "\n".join(lines) if lines else "ナレッジなし"
+            self._context_cache[limit] = cached
+        return cached
 
 
 __all__ = ["KnowledgeBase"]
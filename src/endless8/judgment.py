@@ -16,6 +16,7 @@ from endless8.models import (
     CriterionType,
     ExecutionSummary,
     JudgmentResult,
+    filter_semantic_criteria,
 )
 
 logger = logging.getLogger(__name__)
@@ -152,15 +153,16 @@ async def run_judgment_phase(
     )
 
     # Step 2a: コマンドのみ → LLM スキップ
-    if not has_semantic_criteria(criteria):
+    semantic_criteria = filter_semantic_criteria(criteria)
+    if not semantic_criteria:
         return build_judgment_result_from_commands(command_evaluations)
 
     # Step 2b: セマンティック条件あり → LLM 判定
     if judgment_agent_run is None:
         raise RuntimeError("Judgment agent not configured")
 
-    semantic_criteria = [c for c in criteria if isinstance(c, str)]
-    judgment_context = JudgmentContext(
+    # trusted: criteria and summary are validated at ingress
+    judgment_context = JudgmentContext.model_construct(
         task=task,
         criteria=semantic_criteria,
         execution_summary=summary,
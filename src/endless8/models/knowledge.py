@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class KnowledgeType(StrEnum):
@@ -32,6 +32,8 @@ def _utc_now() -> datetime:
 class Knowledge(BaseModel):
     """ナレッジエントリ。"""
 
+    model_config = ConfigDict(frozen=True)
+
     type: KnowledgeType
     category: str = Field(..., description="カテゴリ（例: error_handling, testing）")
     content: str = Field(..., description="ナレッジの内容")
@@ -2,9 +2,10 @@
 
 from datetime import UTC, datetime
 from enum import StrEnum
+from functools import partial
 from typing import NotRequired, TypedDict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProgressEventType(StrEnum):
@@ -19,11 +20,6 @@ class ProgressEventType(StrEnum):
     JUDGMENT_COMPLETE = "judgment_complete"  # 判定完了
 
 
-def _utc_now() -> datetime:
-    """Return current UTC time."""
-    return datetime.now(UTC)
-
-
 class TaskStartData(TypedDict):
     """TASK_START イベントのデータ。"""
 
@@ -59,10 +55,12 @@ ProgressData = TaskStartData | StatusData | JudgmentData | IterationEndData
 class ProgressEvent(BaseModel):
     """進捗イベント。"""
 
+    model_config = ConfigDict(frozen=True)
+
     event_type: ProgressEventType
     iteration: int | None = Field(None, description="イテレーション番号")
     message: str = Field(..., description="進捗メッセージ")
-    timestamp: datetime = Field(default_factory=_utc_now)
+    timestamp: datetime = Field(default_factory=partial(datetime.now, UTC))
     data: ProgressData | None = Field(None, description="追加データ")
 
 
@@ -3,7 +3,7 @@
 from enum import StrEnum
 from typing import Self
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from endless8.models.criteria import CriterionType
 
@@ -36,6 +36,8 @@ class LoopStatus(StrEnum):
 class IntakeResult(BaseModel):
     """受付エージェントの出力。"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: IntakeStatus
     task: str = Field(..., description="構造化されたタスク")
     criteria: list[str] = Field(..., description="構造化された完了条件")
@@ -54,6 +56,8 @@ class IntakeResult(BaseModel):
 class SemanticMetadata(BaseModel):
     """実行エージェントが報告するセマンティックメタデータ。"""
 
+    model_config = ConfigDict(frozen=True)
+
     approach: str = Field(..., description="採用したアプローチ")
     strategy_tags: list[str] = Field(default_factory=list, description="戦略タグ")
     discoveries: list[str] = Field(default_factory=list, description="発見事項")
@@ -62,6 +66,8 @@ class SemanticMetadata(BaseModel):
 class ExecutionResult(BaseModel):
     """実行エージェントの出力。"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: ExecutionStatus
     output: str = Field(..., description="実行結果の説明")
     artifacts: list[str] = Field(
@@ -85,6 +91,8 @@ class CommandResult(BaseModel):
 class CriteriaEvaluation(BaseModel):
     """各完了条件の評価。"""
 
+    model_config = ConfigDict(frozen=True)
+
     criterion: str = Field(..., description="完了条件")
     is_met: bool = Field(..., description="条件を満たしているか")
     evidence: str = Field(..., description="判定の根拠")
@@ -118,6 +126,8 @@ class CriteriaEvaluation(BaseModel):
 class JudgmentResult(BaseModel):
     """判定エージェントの出力。"""
 
+    model_config = ConfigDict(frozen=True)
+
     is_complete: bool = Field(..., description="すべての条件を満たしているか")
     evaluations: list[CriteriaEvaluation] = Field(..., description="各条件の評価")
     overall_reason: str = Field(..., description="総合的な判定理由")
@@ -136,6 +146,8 @@ class JudgmentResult(BaseModel):
 class LoopResult(BaseModel):
     """ループ全体の最終結果。"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: LoopStatus
     iterations_used: int = Field(..., ge=0, description="実行したイテレーション数")
     final_judgment: JudgmentResult | None = Field(None, description="最終判定結果")
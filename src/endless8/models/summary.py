@@ -2,7 +2,7 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from endless8.models.results import ExecutionStatus
 
@@ -42,6 +42,8 @@ class SummaryLLMOutput(BaseModel):
 class SummaryMetadata(BaseModel):
     """機械的に抽出されるメタデータ。"""
 
+    model_config = ConfigDict(frozen=True)
+
     tools_used: list[str] = Field(default_factory=list, description="使用したツール")
     files_modified: list[str] = Field(
         default_factory=list, description="変更したファイル"
@@ -54,6 +56,8 @@ class SummaryMetadata(BaseModel):
 class NextAction(BaseModel):
     """次のアクションに関する情報。"""
 
+    model_config = ConfigDict(frozen=True)
+
     suggested_action: str = Field(..., description="推奨アクション")
     blockers: list[str] = Field(default_factory=list, description="ブロッカー")
     partial_progress: str | None = Field(None, description="部分的な進捗")
@@ -63,6 +67,8 @@ class NextAction(BaseModel):
 class ExecutionSummary(BaseModel):
     """サマリエージェントの出力（履歴に保存）。"""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(default="summary", description="レコードタイプ")
     iteration: int = Field(..., ge=1, description="イテレーション番号")
     approach: str = Field(..., description="採用したアプローチ")
@@ -1,6 +1,6 @@
 """Task input models for endless8."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from endless8.models.criteria import CriterionInput
 
@@ -15,6 +15,8 @@ class TaskInput(BaseModel):
         history_context_size: 参照する履歴の件数
     """
 
+    model_config = ConfigDict(frozen=True)
+
     task: str = Field(..., description="タスクの説明（自然言語）", min_length=1)
     criteria: list[CriterionInput] = Field(
         ..., description="完了条件のリスト", min_length=1
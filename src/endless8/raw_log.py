@@ -21,10 +21,10 @@ logger = logging.getLogger(__name__)
 class RawLogCollector:
     """Collects raw messages from execution agent and serializes to JSONL.
 
-    The JSONL output is compatible with SummaryAgent's parsers:
-    - _parse_tools_from_log: expects {"type": "tool_use", "name": "..."}
-    - _parse_files_from_log: expects {"type": "tool_use", "name": "Edit/Write", "input": {"file_path": "..."}}
-    - _parse_tokens_from_log: expects {"usage": {"input_tokens": N, "output_tokens": N}}
+    The JSONL output is compatible with SummaryAgent's _parse_log, which expects:
+    - tools: {"type": "tool_use", "name": "..."}
+    - files: {"type": "tool_use", "name": "Edit/Write", "input": {"file_path": "..."}}
+    - tokens: {"usage": {"input_tokens": N, "output_tokens": N}}
     """
 
     def __init__(self) -> None:
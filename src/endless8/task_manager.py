@@ -219,7 +219,8 @@ class TaskManager:
                 self._config.knowledge_context_size
             )
 
-            context = ExecutionContext(
+            # trusted: config is validated at ingress
+            context = ExecutionContext.model_construct(
                 task=self._config.task,
                 criteria=filter_semantic_criteria(self._config.criteria),
                 iteration=iteration,
@@ -36,7 +36,7 @@ class TestCLI:
         """Test that run command creates .e8 directory."""
         from endless8.cli.main import app
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = AsyncMock()
             mock_engine.run.return_value = AsyncMock(
                 status="completed",
@@ -69,7 +69,7 @@ class TestCLI:
         """Test that run command accepts multiple criteria."""
         from endless8.cli.main import app
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = AsyncMock()
             mock_engine.run.return_value = AsyncMock(
                 status="completed",
@@ -104,7 +104,7 @@ class TestCLI:
         """Test that run command accepts max-iterations option."""
         from endless8.cli.main import app
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = AsyncMock()
             mock_engine.run.return_value = AsyncMock(
                 status="completed",
@@ -99,7 +99,7 @@ class TestRunCommand:
         """Test that run shows task information before execution."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -124,7 +124,7 @@ class TestRunCommand:
         """Test that run creates .e8 directory."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -151,7 +151,7 @@ class TestRunCommand:
         """Test that run uses default max_iterations of 10."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -175,7 +175,7 @@ class TestRunCommand:
         """Test that run shows completed status."""
         mock_result = make_completed_result(iterations=3)
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -203,7 +203,7 @@ class TestRunCommand:
             iterations_used=10,
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -232,7 +232,7 @@ class TestRunCommand:
             error_message="Test error",
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -409,7 +409,7 @@ class TestResumeOption:
             ),
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -497,7 +497,7 @@ class TestVerboseOption:
         """Test that --verbose option is accepted."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -522,7 +522,7 @@ class TestVerboseOption:
         """Test that -V short option works."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -550,8 +550,8 @@ class TestVerboseOption:
         mock_result = make_completed_result()
 
         with (
-            patch("endless8.cli.main.Engine") as mock_engine_class,
-            patch("endless8.cli.main.ExecutionAgent") as mock_exec_agent_class,
+            patch("endless8.engine.Engine") as mock_engine_class,
+            patch("endless8.agents.execution.ExecutionAgent") as mock_exec_agent_class,
         ):
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
@@ -583,8 +583,8 @@ class TestVerboseOption:
         mock_result = make_completed_result()
 
         with (
-            patch("endless8.cli.main.Engine") as mock_engine_class,
-            patch("endless8.cli.main.ExecutionAgent") as mock_exec_agent_class,
+            patch("endless8.engine.Engine") as mock_engine_class,
+            patch("endless8.agents.execution.ExecutionAgent") as mock_exec_agent_class,
         ):
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
@@ -686,7 +686,7 @@ class TestConfigFileOverride:
 
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -725,7 +725,7 @@ class TestConfigFileOverride:
 
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -764,7 +764,7 @@ class TestConfigFileOverride:
 
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -837,7 +837,7 @@ class TestCommandTimeoutOption:
         """Test that --command-timeout option is accepted by CLI."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -865,7 +865,7 @@ class TestCommandTimeoutOption:
         """Test that --command-timeout value is passed to EngineConfig."""
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -906,7 +906,7 @@ class TestCommandTimeoutOption:
 
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -946,7 +946,7 @@ class TestCommandTimeoutOption:
 
         mock_result = make_completed_result()
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -979,7 +979,7 @@ class TestProgressCallbackEvents:
             iterations_used=1,
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1018,8 +1018,8 @@ class TestProgressCallbackEvents:
         )
 
         with (
-            patch("endless8.cli.main.Engine") as mock_engine_class,
-            patch("endless8.cli.main.load_config") as mock_load_config,
+            patch("endless8.engine.Engine") as mock_engine_class,
+            patch("endless8.config.load_config") as mock_load_config,
         ):
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
@@ -1087,7 +1087,7 @@ class TestProgressCallbackEvents:
             final_judgment=judgment,
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1136,7 +1136,7 @@ class TestProgressCallbackEvents:
             final_judgment=judgment,
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1279,7 +1279,7 @@ class TestInjectResultCommand:
             history_path=str(history_path),  # Convert Path to string
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1370,6 +1370,52 @@ class TestListCommandStatusParsing:
 
         assert re.search(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", result.output)
 
+    def test_list_limit_shows_newest_tasks(
+        self, runner: CliRunner, temp_dir: Path
+    ) -> None:
+        """Test that --limit shows only the newest tasks but counts all."""
+        tasks_dir = temp_dir / ".e8" / "tasks"
+        for task_id in ("20240101-100000", "20240102-100000", "20240103-100000"):
+            (tasks_dir / task_id).mkdir(parents=True)
+
+        result = runner.invoke(
+            app, ["list", "--project", str(temp_dir), "--limit", "2"]
+        )
+        assert result.exit_code == 0
+        assert "20240103-100000" in result.output
+        assert "20240102-100000" in result.output
+        assert "20240101-100000" not in result.output
+        assert result.output.index("20240103-100000") < result.output.index(
+            "20240102-100000"
+        )
+        assert "合計: 3 タスク" in result.output
+
+    def test_last_history_result_spans_read_blocks(self, temp_dir: Path) -> None:
+        """Test that the tail reader joins records split across blocks."""
+        import json
+
+        from endless8.cli import main as cli_main
+
+        history_file = temp_dir / "history.jsonl"
+        records = [{"result": "success", "iteration": i} for i in range(1, 50)]
+        records.append({"result": "failure", "iteration": 50, "pad": "x" * 100})
+        history_file.write_text(
+            "\n".join(json.dumps(r) for r in records) + "\nnot valid json{{\n"
+        )
+
+        with patch.object(cli_main, "_TAIL_BLOCK_SIZE", 16):
+            assert cli_main._last_history_result(history_file) == "failure"
+        assert cli_main._count_lines(history_file) == 51
+
+    def test_count_lines_without_trailing_newline(self, temp_dir: Path) -> None:
+        """Test that a final line without a newline is counted."""
+        from endless8.cli.main import _count_lines
+
+        history_file = temp_dir / "history.jsonl"
+        history_file.write_text('{"result": "success"}\n{"result": "error"}')
+
+        assert _count_lines(history_file) == 2
+
 
 class TestMaxTurnsWiring:
     """Tests for max_turns wiring from config to agents."""
@@ -1398,11 +1444,11 @@ class TestMaxTurnsWiring:
         mock_result = make_completed_result()
 
         with (
-            patch("endless8.cli.main.Engine") as mock_engine_class,
-            patch("endless8.cli.main.IntakeAgent") as mock_intake,
-            patch("endless8.cli.main.ExecutionAgent") as mock_execution,
-            patch("endless8.cli.main.SummaryAgent") as mock_summary,
-            patch("endless8.cli.main.JudgmentAgent") as mock_judgment,
+            patch("endless8.engine.Engine") as mock_engine_class,
+            patch("endless8.agents.intake.IntakeAgent") as mock_intake,
+            patch("endless8.agents.execution.ExecutionAgent") as mock_execution,
+            patch("endless8.agents.summary.SummaryAgent") as mock_summary,
+            patch("endless8.agents.judgment.JudgmentAgent") as mock_judgment,
         ):
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
@@ -1455,11 +1501,11 @@ class TestModelNameWiring:
         mock_result = make_completed_result()
 
         with (
-            patch("endless8.cli.main.Engine") as mock_engine_class,
-            patch("endless8.cli.main.IntakeAgent") as mock_intake,
-            patch("endless8.cli.main.ExecutionAgent") as mock_execution,
-            patch("endless8.cli.main.SummaryAgent") as mock_summary,
-            patch("endless8.cli.main.JudgmentAgent") as mock_judgment,
+            patch("endless8.engine.Engine") as mock_engine_class,
+            patch("endless8.agents.intake.IntakeAgent") as mock_intake,
+            patch("endless8.agents.execution.ExecutionAgent") as mock_execution,
+            patch("endless8.agents.summary.SummaryAgent") as mock_summary,
+            patch("endless8.agents.judgment.JudgmentAgent") as mock_judgment,
         ):
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
@@ -1520,7 +1566,7 @@ class TestCommandExecutionErrorDisplay:
             ),
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1555,7 +1601,7 @@ class TestCommandExecutionErrorDisplay:
             error_message="Command 'slow_cmd' timed out after 30s",
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1590,7 +1636,7 @@ class TestCommandExecutionErrorDisplay:
             ),
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1622,7 +1668,7 @@ class TestCommandExecutionErrorDisplay:
             error_message="Command 'zombie_cmd' finished without return code",
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1654,7 +1700,7 @@ class TestCommandExecutionErrorDisplay:
             error_message="Some unexpected error occurred",
         )
 
-        with patch("endless8.cli.main.Engine") as mock_engine_class:
+        with patch("endless8.engine.Engine") as mock_engine_class:
             mock_engine = MagicMock()
             mock_engine.run = AsyncMock(return_value=mock_result)
             mock_engine_class.return_value = mock_engine
@@ -1748,3 +1794,26 @@ class TestStatusWithTaskId:
             ["status", "--project", str(tmp_path), "--task-id", "nonexistent"],
         )
         assert result.exit_code == 1
+
+
+class TestLazyImports:
+    """Tests for deferred engine/agent imports in the CLI module."""
+
+    def test_cli_import_does_not_load_engine(self) -> None:
+        """Importing the CLI does not import the engine, agents or config loader."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, endless8.cli.main; "
+            "print(any(m in sys.modules for m in "
+            "('endless8.engine', 'endless8.agents.execution', 'pydantic_ai', "
+            "'endless8.config', 'yaml', 'pydantic')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
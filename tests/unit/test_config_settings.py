@@ -66,6 +66,20 @@ class TestEngineConfigCriteria:
         assert config.command_timeout == 60.0
 
 
+class TestClaudeOptionsDefaults:
+    """Tests for ClaudeOptions defaults."""
+
+    def test_allowed_tools_default_is_not_shared(self) -> None:
+        """Default allowed_tools list is not shared between instances."""
+        from endless8.config import DEFAULT_ALLOWED_TOOLS, ClaudeOptions
+
+        first = ClaudeOptions()
+        second = ClaudeOptions()
+        assert first.allowed_tools == list(DEFAULT_ALLOWED_TOOLS)
+        first.allowed_tools.append("Glob")
+        assert second.allowed_tools == ["Read", "Edit", "Write", "Bash"]
+
+
 class TestLoadConfigWithCommandCriteria:
     """Tests for load_config parsing YAML with command criteria."""
 
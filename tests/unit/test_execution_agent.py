@@ -432,3 +432,74 @@ class TestRawOutputContextPrompt:
         prompt = agent._build_prompt(context)
 
         assert "前回の生出力" not in prompt
+
+
+class TestContextCompression:
+    """Tests for compressing oversized history/knowledge context."""
+
+    def test_short_context_passes_through(self) -> None:
+        """Test that context within the limit is unchanged."""
+        from endless8.agents.execution import _compress_context
+
+        text = "[Iteration 1] a -> success: ok\n[Iteration 1] a -> success: ok"
+        assert _compress_context(text, max_chars=100) is text
+
+    def test_long_context_keeps_most_recent_lines(self) -> None:
+        """Test that oversized context drops duplicates and oldest lines."""
+        from endless8.agents.execution import _compress_context
+
+        lines = [f"[Iteration {i}] approach -> failure: reason" for i in range(1, 21)]
+        lines.insert(5, lines[4])  # consecutive duplicate
+        result = _compress_context("\n".join(lines), max_chars=200)
+
+        result_lines = result.splitlines()
+        assert result_lines[0].startswith("（古い ")
+        assert result_lines[-1] == "[Iteration 20] approach -> failure: reason"
+        assert len(result) <= 200
+
+    def test_single_oversized_line_keeps_head_and_tail(self) -> None:
+        """Test that a lone line over the limit is cut to its head and tail."""
+        from endless8.agents.execution import _compress_context
+
+        text = "a" * 4500 + "b" * 4500
+        result = _compress_context(text, max_chars=4000)
+
+        assert len(result) <= 4000
+        assert result.startswith("a" * 1000)
+        assert result.endswith("b" * 1000)
+        assert "（中略 " in result
+
+    def test_oversized_newest_line_in_history_is_bounded(self) -> None:
+        """Test that one huge iteration line does not bypass the limit."""
+        from endless8.agents.execution import _compress_context
+
+        lines = [f"[Iteration {i}] approach -> success: ok" for i in range(1, 5)]
+        lines.append("[Iteration 5] approach -> failure: " + "x" * 20000)
+        result = _compress_context("\n".join(lines))
+
+        assert len(result) <= 4000
+        result_lines = result.splitlines()
+        assert result_lines[0] == "（古い 4 行を省略）"
+        assert result_lines[1].startswith("[Iteration 5]")
+
+    async def test_prompt_compresses_long_history(self) -> None:
+        """Test that _build_prompt compresses an oversized history context."""
+        from endless8.agents.execution import ExecutionAgent
+
+        history = "\n".join(
+            f"[Iteration {i}] " + "x" * 100 + f" -> failure: {i}" for i in range(100)
+        )
+        context = ExecutionContext(
+            task="テスト",
+            criteria=["条件"],
+            iteration=101,
+            history_context=history,
+            knowledge_context="ナレッジなし",
+            working_directory="/tmp/test-workspace",
+        )
+
+        prompt = ExecutionAgent()._build_prompt(context)
+
+        assert "[Iteration 99]" in prompt
+        assert "[Iteration 0]" not in prompt
+        assert "ナレッジなし" in prompt
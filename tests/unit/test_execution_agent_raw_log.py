@@ -99,3 +99,33 @@ class TestExecutionAgentRawLog:
 
                 call_kwargs = mock_factory.call_args.kwargs
                 assert call_kwargs["message_callback"] is original_callback
+
+    async def test_fresh_model_built_per_run(self) -> None:
+        """Each run builds a new model so iterations never share one."""
+        agent = ExecutionAgent()
+        context = ExecutionContext(
+            task="test",
+            criteria=["c1"],
+            iteration=1,
+            history_context="none",
+            knowledge_context="none",
+            working_directory="/tmp/test",
+        )
+
+        with (
+            patch("endless8.agents.execution.create_agent_model") as mock_factory,
+            patch("endless8.agents.execution.Agent") as mock_agent_cls,
+        ):
+            mock_agent = AsyncMock()
+            mock_agent_cls.return_value = mock_agent
+            mock_agent.run.return_value = MagicMock(output=MagicMock())
+
+            await agent.run(context)
+            await agent.run(context)
+            assert mock_factory.call_count == 2
+            assert mock_agent_cls.call_count == 2
+
+            agent.raw_log_collector = RawLogCollector()
+            await agent.run(context)
+            assert mock_factory.call_count == 3
+            assert mock_factory.call_args.kwargs["message_callback"] is not None
@@ -437,6 +437,88 @@ class TestHistory:
         assert '"type": "judgment"' in content
         assert '"type": "final_result"' in content
 
+    async def test_history_context_string_reflects_appends(
+        self,
+        temp_history_path: Path,
+        sample_summary: ExecutionSummary,
+    ) -> None:
+        """Test that cached context is refreshed after each append."""
+        from endless8.history import History
+
+        history = History(history_path=temp_history_path)
+        assert await history.get_context_string(limit=1) == "履歴なし"
+
+        await history.append(sample_summary)
+        first = await history.get_context_string(limit=1)
+        assert first == "[Iteration 1] テスト追加 -> success: テストファイル作成完了"
+
+        await history.append(
+            sample_summary.model_copy(update={"iteration": 2, "approach": "次の手"})
+        )
+        second = await history.get_context_string(limit=1)
+        assert second.startswith("[Iteration 2] 次の手")
+        assert "[Iteration 1]" not in second
+
+    async def test_history_skips_invalid_json_lines_on_load(
+        self,
+        temp_history_path: Path,
+        sample_summary: ExecutionSummary,
+    ) -> None:
+        """Test that invalid JSON lines are skipped when reloading history."""
+        from endless8.history import History
+
+        history = History(history_path=temp_history_path)
+        await history.append(sample_summary)
+        with temp_history_path.open("a", encoding="utf-8") as f:
+            f.write("{broken json\n")
+
+        reloaded = History(history_path=temp_history_path)
+        summaries = await reloaded.get_recent(limit=5)
+        assert len(summaries) == 1
+        assert summaries[0].approach == "テスト追加"
+        assert summaries[0].metadata.tokens_used == 10000
+
+    async def test_history_loads_summary_without_timestamp(
+        self,
+        temp_history_path: Path,
+    ) -> None:
+        """Test that summary rows missing a timestamp still load."""
+        import json
+
+        from endless8.history import History
+
+        temp_history_path.parent.mkdir(parents=True, exist_ok=True)
+        row = {
+            "type": "summary",
+            "iteration": 1,
+            "approach": "旧形式",
+            "result": "success",
+            "reason": "タイムスタンプなし",
+        }
+        temp_history_path.write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+        summaries = await History(history_path=temp_history_path).get_recent(limit=5)
+        assert len(summaries) == 1
+        assert summaries[0].approach == "旧形式"
+        assert summaries[0].timestamp == ""
+
+    async def test_history_skips_invalid_summary_rows_on_load(
+        self,
+        temp_history_path: Path,
+        sample_summary: ExecutionSummary,
+    ) -> None:
+        """Test that summary rows failing validation are skipped."""
+        from endless8.history import History
+
+        history = History(history_path=temp_history_path)
+        await history.append(sample_summary)
+        with temp_history_path.open("a", encoding="utf-8") as f:
+            f.write('{"type": "summary", "iteration": 0, "approach": "x"}\n')
+
+        summaries = await History(history_path=temp_history_path).get_recent(limit=5)
+        assert len(summaries) == 1
+        assert summaries[0].approach == "テスト追加"
+
 
 class TestHistoryWriteErrors:
     """Tests for history write error handling."""
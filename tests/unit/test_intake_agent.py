@@ -346,6 +346,33 @@ class TestIntakeAgentMaxTurns:
             call_kwargs = mock_create_model.call_args
             assert call_kwargs.kwargs.get("max_turns") == 20
 
+    async def test_agent_reused_across_runs(self) -> None:
+        """Test that the model and agent are built once per IntakeAgent."""
+        from endless8.agents.intake import IntakeAgent
+
+        with (
+            patch("endless8.agents.intake.Agent") as mock_agent_class,
+            patch("endless8.agents.intake.create_agent_model") as mock_create_model,
+        ):
+            mock_agent = AsyncMock()
+            mock_agent.run.return_value = MagicMock(
+                output=IntakeResult(
+                    status=IntakeStatus.ACCEPTED,
+                    task="タスク",
+                    criteria=["条件"],
+                )
+            )
+            mock_agent_class.return_value = mock_agent
+            mock_create_model.return_value = "mock_model"
+
+            agent = IntakeAgent()
+            await agent.run(task="タスク", criteria=["条件"])
+            await agent.run(task="タスク2", criteria=["条件2"])
+
+            mock_create_model.assert_called_once()
+            mock_agent_class.assert_called_once()
+            assert mock_agent.run.call_count == 2
+
     async def test_max_turns_default_value(self) -> None:
         """Test that default max_turns is 10."""
         from endless8.agents.intake import IntakeAgent
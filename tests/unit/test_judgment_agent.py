@@ -1153,6 +1153,8 @@ class TestJudgmentAgentRetryOnCLIExecutionError:
 
             assert result.is_complete is True
             assert mock_agent.run.call_count == 2
+            # A fresh agent is built for the retry after the CLI error
+            assert mock_agent_class.call_count == 2
 
     async def test_no_retry_on_non_recoverable_cli_error(
         self,
@@ -1220,6 +1222,66 @@ class TestJudgmentAgentRetryOnCLIExecutionError:
 
             assert mock_agent.run.call_count == 1
 
+    async def test_retry_delay_uses_jittered_exponential_backoff(
+        self,
+        judgment_context: JudgmentContext,
+    ) -> None:
+        """Retry delays double per attempt and are scaled by jitter."""
+        from endless8.agents.judgment import JudgmentAgent
+
+        with (
+            patch("endless8.agents.judgment.Agent") as mock_agent_class,
+            patch("endless8.agents.judgment.random.random", return_value=1.0),
+            patch(
+                "endless8.agents.judgment.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            mock_agent = AsyncMock()
+            mock_agent.run.side_effect = CLIExecutionError(
+                "SDK query timed out after 300.0 seconds",
+                error_type="timeout",
+                recoverable=True,
+            )
+            mock_agent_class.return_value = mock_agent
+
+            agent = JudgmentAgent(max_retries=3, retry_delay=2.0)
+
+            with pytest.raises(CLIExecutionError):
+                await agent.run(judgment_context)
+
+            assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0]
+
+    async def test_retries_stop_when_backoff_budget_exhausted(
+        self,
+        judgment_context: JudgmentContext,
+    ) -> None:
+        """Retries stop once the total backoff wait would exceed the timeout."""
+        from endless8.agents.judgment import JudgmentAgent
+
+        with (
+            patch("endless8.agents.judgment.Agent") as mock_agent_class,
+            patch("endless8.agents.judgment.random.random", return_value=1.0),
+            patch(
+                "endless8.agents.judgment.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            mock_agent = AsyncMock()
+            mock_agent.run.side_effect = CLIExecutionError(
+                "SDK query timed out after 30.0 seconds",
+                error_type="timeout",
+                recoverable=True,
+            )
+            mock_agent_class.return_value = mock_agent
+
+            # Delays would be 20s then 30s (capped); budget is 30s
+            agent = JudgmentAgent(max_retries=5, retry_delay=20.0, timeout=30.0)
+
+            with pytest.raises(CLIExecutionError):
+                await agent.run(judgment_context)
+
+            assert mock_agent.run.call_count == 2
+            assert [c.args[0] for c in mock_sleep.call_args_list] == [20.0]
+
 
 # --- Issue #49: Command confidence crash fix ---
 
@@ -118,6 +118,37 @@ class TestKnowledgeBase:
         assert len(test_items) == 1
         assert "テスト関連" in test_items[0].content
 
+    async def test_knowledge_base_query_returns_latest_matches_in_order(
+        self,
+        temp_knowledge_path: Path,
+    ) -> None:
+        """Test that query applies both filters and keeps the newest matches."""
+        from endless8.history import KnowledgeBase
+
+        kb = KnowledgeBase(knowledge_path=temp_knowledge_path)
+        await kb.add_many(
+            [
+                Knowledge(
+                    type=knowledge_type,
+                    category=category,
+                    content=f"{category}-{i}",
+                    source_task="test",
+                    confidence=KnowledgeConfidence.HIGH,
+                )
+                for i in range(5)
+                for knowledge_type, category in (
+                    (KnowledgeType.DISCOVERY, "testing"),
+                    (KnowledgeType.LESSON, "testing"),
+                    (KnowledgeType.DISCOVERY, "build"),
+                )
+            ]
+        )
+
+        results = await kb.query(
+            type_filter=KnowledgeType.DISCOVERY, category_filter="testing", limit=3
+        )
+        assert [k.content for k in results] == ["testing-2", "testing-3", "testing-4"]
+
     async def test_knowledge_base_generates_context_string(
         self,
         temp_knowledge_path: Path,
@@ -194,6 +225,29 @@ class TestKnowledgeBase:
         items = await kb2.get_all()
         assert len(items) == 1
 
+    async def test_knowledge_base_record_key_order(
+        self,
+        temp_knowledge_path: Path,
+        sample_knowledge: Knowledge,
+    ) -> None:
+        """Test that persisted records keep the on-disk key order."""
+        import json
+
+        from endless8.history import KnowledgeBase
+
+        kb = KnowledgeBase(knowledge_path=temp_knowledge_path)
+        await kb.add(sample_knowledge)
+
+        record = json.loads(temp_knowledge_path.read_text(encoding="utf-8"))
+        assert list(record) == [
+            "type",
+            "category",
+            "content",
+            "source_task",
+            "confidence",
+            "example_file",
+        ]
+
     async def test_knowledge_base_add_multiple(
         self,
         temp_knowledge_path: Path,
@@ -218,3 +272,51 @@ class TestKnowledgeBase:
 
         all_items = await kb.get_all()
         assert len(all_items) == 3
+
+        # All items are persisted and reloadable in order
+        lines = temp_knowledge_path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        reloaded = await KnowledgeBase(knowledge_path=temp_knowledge_path).get_all()
+        assert [k.content for k in reloaded] == ["発見 1", "発見 2", "発見 3"]
+
+    async def test_knowledge_base_skips_invalid_lines_on_load(
+        self,
+        temp_knowledge_path: Path,
+        sample_knowledge: Knowledge,
+    ) -> None:
+        """Test that malformed or schema-invalid lines are skipped on load."""
+        from endless8.history import KnowledgeBase
+
+        kb = KnowledgeBase(knowledge_path=temp_knowledge_path)
+        await kb.add(sample_knowledge)
+        with temp_knowledge_path.open("a", encoding="utf-8") as f:
+            f.write("{not valid json\n")
+            f.write('{"type": "discovery", "content": "カテゴリなし"}\n')
+
+        kb2 = KnowledgeBase(knowledge_path=temp_knowledge_path)
+        items = await kb2.get_all()
+        assert len(items) == 1
+        assert items[0].content == sample_knowledge.content
+
+    async def test_knowledge_base_context_string_reflects_adds(
+        self,
+        temp_knowledge_path: Path,
+        sample_knowledge: Knowledge,
+    ) -> None:
+        """Test that cached context is refreshed after each add."""
+        from endless8.history import KnowledgeBase
+
+        kb = KnowledgeBase(knowledge_path=temp_knowledge_path)
+        assert await kb.get_context_string(limit=1) == "ナレッジなし"
+
+        await kb.add(sample_knowledge)
+        assert await kb.get_context_string(limit=1) == (
+            "[discovery] 新しいパターンを発見: テストファーストが効果的"
+        )
+
+        await kb.add(
+            sample_knowledge.model_copy(
+                update={"type": KnowledgeType.LESSON, "content": "次の教訓"}
+            )
+        )
+        assert await kb.get_context_string(limit=1) == "[lesson] 次の教訓"
@@ -71,6 +71,20 @@ class TestCreateAgentModel:
             )
             assert model == "mock_model"
 
+    def test_create_agent_model_converts_no_tools_to_list(self) -> None:
+        """Test that the shared NO_TOOLS tuple reaches ClaudeCodeModel as a list."""
+        from endless8.agents.model_factory import NO_TOOLS, create_agent_model
+
+        with (
+            patch("endless8.agents.model_factory._CLAUDECODE_AVAILABLE", True),
+            patch("endless8.agents.model_factory.ClaudeCodeModel") as mock_model,
+        ):
+            create_agent_model("test-model", allowed_tools=NO_TOOLS)
+
+            passed = mock_model.call_args.kwargs["allowed_tools"]
+            assert passed == []
+            assert isinstance(passed, list)
+
     def test_create_agent_model_with_none_allowed_tools(self) -> None:
         """Test that create_agent_model handles None allowed_tools."""
         from endless8.agents.model_factory import create_agent_model
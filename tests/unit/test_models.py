@@ -23,6 +23,8 @@ from endless8.models import (
     KnowledgeType,
     LoopResult,
     LoopStatus,
+    ProgressEvent,
+    ProgressEventType,
     SummaryMetadata,
     TaskInput,
 )
@@ -473,3 +475,42 @@ class TestKnowledge:
                 source_task="タスク",
             )
             assert knowledge.type == ktype
+
+
+class TestProgressEvent:
+    """Tests for ProgressEvent model."""
+
+    def test_progress_event_timestamp_is_utc_aware(self) -> None:
+        """Test that the default timestamp is timezone-aware UTC."""
+        from datetime import UTC
+
+        event = ProgressEvent(
+            event_type=ProgressEventType.TASK_START,
+            message="開始",
+        )
+        assert event.timestamp.tzinfo is UTC
+
+
+class TestSchemaCompleteness:
+    """Tests that model schemas are built at import time."""
+
+    def test_all_models_are_complete_at_import(self) -> None:
+        """Test that no model defers its core schema build to first use."""
+        import inspect
+
+        from pydantic import BaseModel
+
+        import endless8.agents
+        import endless8.config
+        import endless8.models
+
+        incomplete = [
+            name
+            for module in (endless8.models, endless8.agents, endless8.config)
+            for name, obj in vars(module).items()
+            if inspect.isclass(obj)
+            and issubclass(obj, BaseModel)
+            and obj is not BaseModel
+            and not obj.__pydantic_complete__
+        ]
+        assert incomplete == []
@@ -440,6 +440,34 @@ class TestSummaryAgentMaxTurns:
             call_kwargs = mock_create_model.call_args
             assert call_kwargs.kwargs.get("max_turns") == 10
 
+    async def test_agent_reused_across_runs(
+        self,
+        execution_result: ExecutionResult,
+        llm_output: SummaryLLMOutput,
+    ) -> None:
+        """Test that the model and agent are built once per SummaryAgent."""
+        from endless8.agents.summary import SummaryAgent
+
+        mock_run = self._mock_agent_run(llm_output)
+        with (
+            patch("endless8.agents.summary.Agent") as mock_agent_cls,
+            patch(
+                "endless8.agents.summary.create_agent_model",
+                return_value="test-model",
+            ) as mock_create_model,
+        ):
+            mock_agent_instance = MagicMock()
+            mock_agent_instance.run = mock_run
+            mock_agent_cls.return_value = mock_agent_instance
+
+            agent = SummaryAgent(task_description="テスト", model_name="test-model")
+            await agent.run(execution_result, iteration=1, criteria=["テスト条件"])
+            await agent.run(execution_result, iteration=2, criteria=["テスト条件"])
+
+            mock_create_model.assert_called_once()
+            mock_agent_cls.assert_called_once()
+            assert mock_run.call_count == 2
+
 
 class TestSummaryAgentTimeout:
     """Tests for SummaryAgent timeout propagation."""
@@ -501,7 +529,7 @@ class TestSummaryAgentTimeout:
             mock_create_model.assert_called_once_with(
                 "test-model",
                 max_turns=10,
-                allowed_tools=[],
+                allowed_tools=(),
                 timeout=120.0,
             )
 
@@ -796,6 +824,97 @@ class TestBuildPrompt:
         assert "test-first" in prompt
         assert "新発見" in prompt
 
+    def test_build_prompt_truncates_long_output(self) -> None:
+        """Test that oversized execution output is truncated."""
+        from endless8.agents.summary import _MAX_OUTPUT_CHARS, _build_prompt
+
+        result = ExecutionResult(
+            status=ExecutionStatus.SUCCESS,
+            output="a" * _MAX_OUTPUT_CHARS + "b" * 10,
+            artifacts=[],
+        )
+        prompt = _build_prompt(result, iteration=1, criteria=["条件"])
+        assert "a" * _MAX_OUTPUT_CHARS in prompt
+        assert "b" not in prompt
+        assert "（以降 10 文字を省略）" in prompt
+
+
+class TestParseLog:
+    """Tests for _parse_log function."""
+
+    def test_parse_log_extracts_tools_files_and_tokens(self) -> None:
+        """Test that a single pass extracts all mechanical metadata."""
+        from endless8.agents.summary import _parse_log
+
+        raw_log = "\n".join(
+            [
+                '{"type": "tool_use", "name": "Write", "input": {"file_path": "b.py"}}',
+                '{"type": "tool_use", "name": "Bash", "input": {"command": "ls"}}',
+                "",
+                "{not json",
+                '{"type": "tool_use", "name": "Edit", "input": {"path": "a.py"}}',
+                '{"usage": {"input_tokens": 10, "output_tokens": 5}}',
+                '{"type": "tool_use", "name": "Write", "input": {"file_path": "b.py"}}',
+                '{"usage": {"input_tokens": 1}}',
+            ]
+        )
+
+        tools, files, tokens = _parse_log(raw_log)
+
+        assert tools == ["Bash", "Edit", "Write"]
+        assert files == ["a.py", "b.py"]
+        assert tokens == 16
+
+    def test_parse_log_skips_lines_without_metadata(self) -> None:
+        """Test that lines without tool_use or usage are not decoded."""
+        from endless8.agents import summary
+
+        raw_log = "\n".join(
+            [
+                '{"type": "assistant", "text": "thinking"}',
+                '{"type": "system", "subtype": "init"}',
+                '{"type": "tool_use", "name": "Read", "input": {"path": "a.py"}}',
+            ]
+        )
+
+        with patch.object(
+            summary, "_json_loads", wraps=summary._json_loads
+        ) as mock_loads:
+            tools, files, tokens = summary._parse_log(raw_log)
+
+        assert mock_loads.call_count == 1
+        assert tools == ["Read"]
+        assert files == []
+        assert tokens == 0
+
+    def test_parse_log_reports_invalid_lines_once(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that invalid JSON lines produce a single aggregated warning."""
+        from endless8.agents.summary import _parse_log
+
+        raw_log = "\n".join(
+            [
+                '{"type": "tool_use", broken',
+                '{"usage": {"input_tokens": 3}}',
+                '{"usage": broken',
+            ]
+        )
+
+        with caplog.at_level("WARNING", logger="endless8.agents.summary"):
+            _, _, tokens = _parse_log(raw_log)
+
+        assert tokens == 3
+        assert len(caplog.records) == 1
+        assert "Skipped 2 invalid JSON log line(s)" in caplog.text
+        assert '{"type": "tool_use", broken' in caplog.text
+
+    def test_parse_log_empty(self) -> None:
+        """Test that an empty log yields empty metadata."""
+        from endless8.agents.summary import _parse_log
+
+        assert _parse_log("") == ([], [], 0)
+
 
 class TestSummaryAgentLLMFailurePropagation:
     """Tests for SummaryAgent LLM failure exception propagation."""